@@ -11,5 +11,7 @@ import os
 from django.core.asgi import get_asgi_application  # type: ignore
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'afrikoop.settings')
+# Whatever server imports this module serves HTTP (see settings.SERVES_HTTP).
+os.environ.setdefault('DJANGO_ENABLE_ADMIN_UI', '1')
 
 application = get_asgi_application()
\ No newline at end of file
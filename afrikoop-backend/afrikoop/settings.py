@@ -11,8 +11,11 @@ Key configuration points:
 
 * **Installed apps**: In addition to Django's default apps, the ``core``
   app is included. This app defines all project‑specific models and
-  API views.
-* **Middlewares**: The default Django middlewares are enabled. If you
+  API views. The Jazzmin admin theme is only loaded by processes that
+  serve the admin (see ``ADMIN_UI_ENABLED``).
+* **Middlewares**: The default Django middlewares are enabled; the
+  session, auth and message ones come from ``core.middleware`` so they
+  skip the token-authenticated ``/api/`` routes. If you
   wish to allow cross origin requests from a separate frontend, you
   should install and configure ``django-cors-headers`` (not included
   here) and add it to the list.
@@ -30,7 +33,9 @@ https://docs.djangoproject.com/en/4.2/topics/settings/
 """
 from __future__ import annotations
 
+import functools
 import os
+import sys
 from pathlib import Path
 
 
@@ -38,8 +43,13 @@ from pathlib import Path
 BASE_DIR: Path = Path(__file__).resolve().parent.parent
 
 
+@functools.lru_cache(maxsize=None)
 def get_env(key: str, default: str | None = None) -> str:
-    """Helper to read environment variables with a default fallback."""
+    """Helper to read environment variables with a default fallback.
+
+    Results are memoised per ``(key, default)``; call ``get_env.cache_clear()``
+    after changing ``os.environ`` (e.g. in tests) before reloading settings.
+    """
     return os.environ.get(key, default) or ''
 
 
@@ -53,14 +63,22 @@ DEBUG: bool = get_env('DJANGO_DEBUG', 'True') == 'True'
 
 # Hosts/domain names that are valid for this site; required if DEBUG is
 # False. See https://docs.djangoproject.com/en/4.2/ref/settings/#allowed-hosts
-ALLOWED_HOSTS: list[str] = get_env('DJANGO_ALLOWED_HOSTS', '*').split(',')
+ALLOWED_HOSTS: tuple[str, ...] = tuple(
+    host.strip() for host in get_env('DJANGO_ALLOWED_HOSTS', '*').split(',') if host.strip()
+)
+
+# Processes that serve HTTP render the admin UI; ``collectstatic`` needs
+# the theme's assets. ``wsgi.py``/``asgi.py`` set ``DJANGO_ENABLE_ADMIN_UI=1``
+# for every server that loads them, and ``runserver`` is detected here.
+# Other management commands (migrate, shell, ...) skip the Jazzmin theme
+# entirely.
+SERVES_HTTP: bool = get_env('DJANGO_ENABLE_ADMIN_UI') == '1' or 'runserver' in sys.argv
+ADMIN_UI_ENABLED: bool = SERVES_HTTP or 'collectstatic' in sys.argv
 
 
 # Application definition
 
 INSTALLED_APPS: list[str] = [
-    'jazzmin',
-    'corsheaders',
     'django.contrib.admin',
     'django.contrib.auth',
     'django.contrib.contenttypes',
@@ -70,15 +88,21 @@ INSTALLED_APPS: list[str] = [
     # Project apps
     'core',
 ]
+if SERVES_HTTP:
+    # Registers corsheaders' system checks; the middleware itself is
+    # imported lazily by ``core.lazy_cors``.
+    INSTALLED_APPS.insert(0, 'corsheaders')
+if ADMIN_UI_ENABLED:
+    INSTALLED_APPS.insert(0, 'jazzmin')
 
 MIDDLEWARE: list[str] = [
-    'corsheaders.middleware.CorsMiddleware',
+    'core.lazy_cors.LazyCorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'core.middleware.NonApiSessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'core.middleware.NonApiAuthenticationMiddleware',
+    'core.middleware.NonApiMessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
@@ -96,8 +120,9 @@ TEMPLATES: list[dict[str, object]] = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
-            # Provide backwards‑compat filters (e.g., length_is) globally
-            'builtins': ['core.templatetags.compat'],
+            # Provide backwards‑compat filters (e.g., length_is) globally;
+            # only Jazzmin's templates still use them.
+            'builtins': ['core.templatetags.compat'] if 'jazzmin' in INSTALLED_APPS else [],
         },
     },
 ]
@@ -110,10 +135,35 @@ WSGI_APPLICATION: str = 'afrikoop.wsgi.application'
 DATABASES: dict[str, dict[str, object]] = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Set ``REDIS_URL`` (e.g. ``redis://localhost:6379/0``, needs the ``redis``
+# package) so all workers share one cache; otherwise each process keeps
+# its own in memory.
+REDIS_URL: str = get_env('REDIS_URL')
+if REDIS_URL:
+    CACHES: dict[str, dict[str, object]] = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# How long ``core.response_cache`` keeps public content responses. Edits
+# invalidate them at once, but only a shared cache carries that to every
+# worker, so the per-process fallback keeps entries briefly.
+RESPONSE_CACHE_TIMEOUT: int = 24 * 60 * 60 if REDIS_URL else 60
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -150,10 +200,10 @@ USE_TZ: bool = True
 # https://docs.djangoproject.com/en/4.2/howto/static-files/
 
 STATIC_URL: str = '/static/'
-STATIC_ROOT: Path = BASE_DIR / 'staticfiles'
+STATIC_ROOT: str = os.path.join(BASE_DIR, 'staticfiles')
 
 MEDIA_URL: str = '/media/'
-MEDIA_ROOT: Path = BASE_DIR / 'media'
+MEDIA_ROOT: str = os.path.join(BASE_DIR, 'media')
 
 
 # Default primary key field type
@@ -170,63 +220,64 @@ if DEBUG:
     ]
     # If you prefer to allow all in dev, uncomment the next line instead:
     # CORS_ALLOW_ALL_ORIGINS = True
-    CORS_ALLOW_HEADERS = list({
+    CORS_ALLOW_HEADERS = (
         'accept', 'accept-encoding', 'authorization', 'content-type', 'dnt', 'origin', 'user-agent', 'x-requested-with'
-    })
+    )
 
 # Jazzmin (Admin theme) settings — modern UI akin to Django Jet
-JAZZMIN_SETTINGS = {
-    "site_title": "House of Bijou Admin",
-    "site_header": "House of Bijou",
-    "site_brand": "Bijou Admin",
-    "welcome_sign": "Welcome, House of Bijou team",
-    "copyright": "House of Bijou",
-    "site_logo": "core/logo-admin-mark.svg",
-    "site_icon": "core/logo-admin-mark.svg",
-    "site_logo_classes": "brand-image",
-    "show_sidebar": True,
-    "navigation_expanded": True,
-    "hide_apps": [],
-    "hide_models": [
-        "core.TranslatableString",  # keep advanced copy editor hidden from non‑dev admins
-        "core.VolunteerTier",       # superseded by VolunteerGroup
-    ],
-    "order_with_respect_to": [
-        "core.MissionPage",
-        "core.CleaningServicePage",
-        "core.EventsPageSettings",
-        "core.Event",
-        "core.EventRegistration",
-        "core.VolunteerGroup",
-        "core.ContactMessage",
-        "core.TranslatableString",
-    ],
-    "icons": {
-        "core.MissionPage": "fas fa-bullseye",
-        "core.CleaningServicePage": "fas fa-broom",
-        "core.EventsPageSettings": "fas fa-image",
-        "core.Event": "fas fa-calendar-alt",
-        "core.EventRegistration": "fas fa-user-check",
-        "core.VolunteerGroup": "fas fa-handshake",
-        "core.ContactMessage": "fas fa-envelope",
-        "core.TranslatableString": "fas fa-language",
-        "core.SiteTextSettings": "fas fa-font",
-        "core.Token": "fas fa-key",
-        "auth.User": "fas fa-user",
-        "auth.Group": "fas fa-users",
-    },
-    "topmenu_links": [
-        {"name": "Dashboard", "url": "admin:index", "permissions": ["auth.view_user"]},
-        {"name": "Guide", "url": "/admin/#guide"},
-        {"name": "Site", "url": "/", "new_window": True},
-    ],
-}
+if ADMIN_UI_ENABLED:
+    JAZZMIN_SETTINGS = {
+        "site_title": "House of Bijou Admin",
+        "site_header": "House of Bijou",
+        "site_brand": "Bijou Admin",
+        "welcome_sign": "Welcome, House of Bijou team",
+        "copyright": "House of Bijou",
+        "site_logo": "core/logo-admin-mark.svg",
+        "site_icon": "core/logo-admin-mark.svg",
+        "site_logo_classes": "brand-image",
+        "show_sidebar": True,
+        "navigation_expanded": True,
+        "hide_apps": [],
+        "hide_models": [
+            "core.TranslatableString",  # keep advanced copy editor hidden from non‑dev admins
+            "core.VolunteerTier",       # superseded by VolunteerGroup
+        ],
+        "order_with_respect_to": [
+            "core.MissionPage",
+            "core.CleaningServicePage",
+            "core.EventsPageSettings",
+            "core.Event",
+            "core.EventRegistration",
+            "core.VolunteerGroup",
+            "core.ContactMessage",
+            "core.TranslatableString",
+        ],
+        "icons": {
+            "core.MissionPage": "fas fa-bullseye",
+            "core.CleaningServicePage": "fas fa-broom",
+            "core.EventsPageSettings": "fas fa-image",
+            "core.Event": "fas fa-calendar-alt",
+            "core.EventRegistration": "fas fa-user-check",
+            "core.VolunteerGroup": "fas fa-handshake",
+            "core.ContactMessage": "fas fa-envelope",
+            "core.TranslatableString": "fas fa-language",
+            "core.SiteTextSettings": "fas fa-font",
+            "core.Token": "fas fa-key",
+            "auth.User": "fas fa-user",
+            "auth.Group": "fas fa-users",
+        },
+        "topmenu_links": [
+            {"name": "Dashboard", "url": "admin:index", "permissions": ["auth.view_user"]},
+            {"name": "Guide", "url": "/admin/#guide"},
+            {"name": "Site", "url": "/", "new_window": True},
+        ],
+    }
 
-JAZZMIN_UI_TWEAKS = {
-    "theme": "darkly",  # dark base, still readable
-    "dark_mode_theme": "darkly",
-    "navbar": "navbar-dark",
-    "sidebar": "sidebar-dark-primary",
-    "accent": "accent-pink",
-    "brand_small_text": False,
-}
+    JAZZMIN_UI_TWEAKS = {
+        "theme": "darkly",  # dark base, still readable
+        "dark_mode_theme": "darkly",
+        "navbar": "navbar-dark",
+        "sidebar": "sidebar-dark-primary",
+        "accent": "accent-pink",
+        "brand_small_text": False,
+    }
@@ -16,61 +16,85 @@ Environment variables required:
 - AZURE_POSTGRESQL_NAME: Database name
 - AZURE_POSTGRESQL_USER: Database username
 - AZURE_POSTGRESQL_PASSWORD: Database password
+- SQLITE_JOURNAL_MODE: SQLite fallback journal mode (optional, default DELETE; WAL only on local disk)
 - FRONTEND_URL: Frontend origin for CORS (e.g., "https://example.azurestaticapps.net")
 """
 from __future__ import annotations
 
 import os
-from pathlib import Path
 
 # Import base settings
 from .settings import *  # noqa: F403
 
-# Build paths
-BASE_DIR = Path(__file__).resolve().parent.parent
+# Snapshot the environment once; every setting below reads from it.
+_env = os.environ.copy()
+_log_level = _env.get('DJANGO_LOG_LEVEL', 'INFO')
 
 # Security settings
 DEBUG = False
-SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY')
+SECRET_KEY = _env.get('DJANGO_SECRET_KEY')
 if not SECRET_KEY:
     raise ValueError('DJANGO_SECRET_KEY environment variable must be set in production')
 
 # Allowed hosts
-ALLOWED_HOSTS = os.environ.get('DJANGO_ALLOWED_HOSTS', '').split(',')
-if not ALLOWED_HOSTS or ALLOWED_HOSTS == ['']:
+ALLOWED_HOSTS = tuple(
+    host.strip() for host in _env.get('DJANGO_ALLOWED_HOSTS', '').split(',') if host.strip()
+)
+if not ALLOWED_HOSTS:
     raise ValueError('DJANGO_ALLOWED_HOSTS must be set (comma-separated domains)')
 
 # Database configuration
 # For Azure App Service Free tier, use SQLite on /home (persistent storage)
 # For production, use Azure Database for PostgreSQL
-if os.environ.get('AZURE_POSTGRESQL_HOST'):
+if _env.get('AZURE_POSTGRESQL_HOST'):
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.postgresql',
-            'NAME': os.environ.get('AZURE_POSTGRESQL_NAME', 'afrikoop'),
-            'USER': os.environ.get('AZURE_POSTGRESQL_USER'),
-            'PASSWORD': os.environ.get('AZURE_POSTGRESQL_PASSWORD'),
-            'HOST': os.environ.get('AZURE_POSTGRESQL_HOST'),
-            'PORT': os.environ.get('AZURE_POSTGRESQL_PORT', '5432'),
+            'NAME': _env.get('AZURE_POSTGRESQL_NAME', 'afrikoop'),
+            'USER': _env.get('AZURE_POSTGRESQL_USER'),
+            'PASSWORD': _env.get('AZURE_POSTGRESQL_PASSWORD'),
+            'HOST': _env.get('AZURE_POSTGRESQL_HOST'),
+            'PORT': _env.get('AZURE_POSTGRESQL_PORT', '5432'),
             'OPTIONS': {
                 'sslmode': 'require',  # Azure PostgreSQL requires SSL
             },
+            'CONN_MAX_AGE': 600,  # Persistent database connections (10 min)
         }
     }
 else:
     # Fallback to SQLite on Azure App Service /home (persistent across restarts)
     # Note: This is acceptable for Free tier and low traffic
+    # /home is a network share, where WAL's shared-memory index and mmap are
+    # unsafe, so the default is a rollback journal. Set
+    # SQLITE_JOURNAL_MODE=WAL only when NAME points at local disk; that also
+    # enables synchronous=NORMAL and memory-mapped reads.
+    _sqlite_journal_mode = _env.get('SQLITE_JOURNAL_MODE', 'DELETE').upper()
+    if _sqlite_journal_mode not in {'DELETE', 'TRUNCATE', 'PERSIST', 'WAL'}:
+        raise ValueError('SQLITE_JOURNAL_MODE must be one of DELETE, TRUNCATE, PERSIST or WAL')
+    _sqlite_pragmas = [f'PRAGMA journal_mode={_sqlite_journal_mode};', 'PRAGMA temp_store=MEMORY;']
+    if _sqlite_journal_mode == 'WAL':
+        _sqlite_pragmas += ['PRAGMA synchronous=NORMAL;', 'PRAGMA mmap_size=268435456;']
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': '/home/site/db.sqlite3',  # Azure App Service persistent storage
+            'OPTIONS': {
+                'init_command': ''.join(_sqlite_pragmas),
+            },
+            'CONN_MAX_AGE': 0,
         }
     }
 
 # Static files with WhiteNoise
-MIDDLEWARE.insert(1, 'whitenoise.middleware.WhiteNoiseMiddleware')  # noqa: F405
+# Rebuild rather than insert() so the base module's list is not mutated.
+MIDDLEWARE = (  # noqa: F405
+    *MIDDLEWARE[:1],  # noqa: F405
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    *MIDDLEWARE[1:],  # noqa: F405
+)
+INSTALLED_APPS = tuple(INSTALLED_APPS)  # noqa: F405
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
-STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')  # noqa: F405
 STATIC_URL = '/static/'
 
 # Media files
@@ -86,7 +110,7 @@ MEDIA_URL = '/media/'
 
 # CORS configuration
 # Allow requests from Azure Static Web Apps frontend
-FRONTEND_URL = os.environ.get('FRONTEND_URL', '')
+FRONTEND_URL = _env.get('FRONTEND_URL', '')
 if FRONTEND_URL:
     CORS_ALLOWED_ORIGINS = [FRONTEND_URL]
     CORS_ALLOW_CREDENTIALS = True
@@ -94,7 +118,7 @@ else:
     # Fallback: allow all origins in non-production Azure environments
     CORS_ALLOW_ALL_ORIGINS = True
 
-CORS_ALLOW_HEADERS = [
+CORS_ALLOW_HEADERS = (
     'accept',
     'accept-encoding',
     'authorization',
@@ -104,7 +128,7 @@ CORS_ALLOW_HEADERS = [
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
-]
+)
 
 # Security middleware settings
 SECURE_SSL_REDIRECT = True  # Redirect HTTP to HTTPS
@@ -113,8 +137,7 @@ SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 CSRF_COOKIE_SAMESITE = 'Lax'
 SESSION_COOKIE_SAMESITE = 'Lax'
-CSRF_TRUSTED_ORIGINS = ALLOWED_HOSTS if ALLOWED_HOSTS else []
-CSRF_TRUSTED_ORIGINS = [f'https://{host}' for host in CSRF_TRUSTED_ORIGINS]
+CSRF_TRUSTED_ORIGINS = tuple(f'https://{host}' for host in ALLOWED_HOSTS)
 
 # HSTS (enable after confirming HTTPS works)
 # SECURE_HSTS_SECONDS = 31536000  # 1 year
@@ -148,12 +171,12 @@ LOGGING = {
     },
     'root': {
         'handlers': ['console'],
-        'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
+        'level': _log_level,
     },
     'loggers': {
         'django': {
             'handlers': ['console'],
-            'level': os.environ.get('DJANGO_LOG_LEVEL', 'INFO'),
+            'level': _log_level,
             'propagate': False,
         },
         'core': {
@@ -175,9 +198,6 @@ LOGGING = {
 # DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@example.com')
 # ADMINS = [('Admin', os.environ.get('ADMIN_EMAIL', 'admin@example.com'))]
 
-# Performance optimizations
-CONN_MAX_AGE = 600  # Persistent database connections (10 min)
-
 # Jazzmin admin theme (keep existing settings)
 # The Jazzmin settings from base settings.py are inherited
 
@@ -15,11 +15,14 @@ from django.contrib import admin
 from django.urls import include, path
 
 
+# Serve media files in development
+_MEDIA_PATTERNS = (
+    static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT) if settings.DEBUG else ()
+)
+
 urlpatterns: list = [
-    path('admin/', admin.site.urls),
+    # The API takes most of the traffic; match it before the admin.
     path('api/', include('core.urls')),
+    path('admin/', admin.site.urls),
+    *_MEDIA_PATTERNS,
 ]
-
-# Serve media files in development
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
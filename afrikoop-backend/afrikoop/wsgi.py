@@ -3,6 +3,11 @@ WSGI config for Afrikoop project.
 
 It exposes the WSGI callable as a module‑level variable named ``application``.
 See https://docs.djangoproject.com/en/4.2/howto/deployment/wsgi/ for more details.
+
+Unless ``DJANGO_WARMUP=0`` is set, the URLconf (and with it the admin
+registrations) is imported here, when the worker boots, rather than on
+the first request it serves. The template engines are warmed in
+``CoreConfig.ready``.
 """
 from __future__ import annotations
 
@@ -11,5 +16,12 @@ import os
 from django.core.wsgi import get_wsgi_application  # type: ignore
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'afrikoop.settings')
+# Whatever server imports this module serves HTTP (see settings.SERVES_HTTP).
+os.environ.setdefault('DJANGO_ENABLE_ADMIN_UI', '1')
+
+application = get_wsgi_application()
+
+if os.environ.get('DJANGO_WARMUP', '1') == '1':
+    from django.urls import get_resolver
 
-application = get_wsgi_application()
\ No newline at end of file
+    get_resolver().url_patterns
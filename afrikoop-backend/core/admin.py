@@ -8,7 +8,14 @@ search fields are chosen to make it easy to find and edit entries.
 """
 from __future__ import annotations
 
+from django import forms
 from django.contrib import admin
+from django.db.models import Count
+from django.db.models.functions import Length, Substr
+from django.forms.models import BaseInlineFormSet
+from django.urls import reverse
+from django.utils.html import format_html
+
 from .models import TranslatableString, EventsPageSettings, EventPlaceholder, CleaningFeature, EventImage, CleaningGalleryImage, VolunteerTier, SiteTextSettings, VolunteerGroup, VolunteerMembership
 
 from .models import (  # noqa: F401
@@ -48,9 +55,30 @@ class CleaningServicePageAdmin(admin.ModelAdmin):
     )
 
 
+class RecentRegistrationsFormSet(BaseInlineFormSet):
+    """Only render the most recent registrations of an event."""
+
+    max_rows = 50
+
+    def get_queryset(self):  # type: ignore[no-untyped-def]
+        if not hasattr(self, '_queryset'):
+            self._queryset = super().get_queryset()[:self.max_rows]
+        return self._queryset
+
+
 class EventRegistrationInline(admin.TabularInline):
     model = EventRegistration
+    formset = RecentRegistrationsFormSet
     extra = 0
+    max_num = 0
+    can_delete = False
+    fields = ('user', 'created_at')
+    readonly_fields = ('user', 'created_at')
+    ordering = ('-created_at',)
+    verbose_name_plural = 'Recent registrations'
+
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).select_related('user')
 
 class EventImageInline(admin.TabularInline):
     model = EventImage
@@ -66,8 +94,16 @@ class TranslatableStringAdmin(admin.ModelAdmin):
     search_fields = ('key', 'text')
     ordering = ('namespace', 'key', 'language')
 
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        # Only the first 60 characters are listed; don't ship whole texts.
+        return (
+            super().get_queryset(request)
+            .annotate(_short_text=Substr('text', 1, 60), _text_length=Length('text'))
+            .defer('text')
+        )
+
     def short_text(self, obj):  # type: ignore[no-untyped-def]
-        return (obj.text[:60] + '…') if len(obj.text) > 60 else obj.text
+        return (obj._short_text + '…') if obj._text_length > 60 else obj._short_text
     short_text.short_description = 'text'
     readonly_fields = ('updated_at',)
     fieldsets = (
@@ -128,36 +164,85 @@ class VolunteerTierAdmin(admin.ModelAdmin):
     filter_horizontal = ('members',)
     ordering = ('priority', 'name')
 
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).annotate(_member_count=Count('members'))
+
     def member_count(self, obj):  # type: ignore[no-untyped-def]
-        return obj.members.count()
+        return obj._member_count
     member_count.short_description = 'Members'
+    member_count.admin_order_field = '_member_count'
+
+
+def _label_field(key: str, lang: str) -> forms.CharField:
+    max_length = SiteTextSettings.LABELS[key][0]
+    return forms.CharField(
+        label=f"{key.replace('_', ' ').capitalize()} ({lang})",
+        max_length=max_length,
+        required=False,
+    )
+
+
+class SiteTextSettingsForm(forms.ModelForm):
+    """Edit ``SiteTextSettings.labels`` as one text box per label and language.
+
+    Every key of ``SiteTextSettings.LABELS`` has a ``<key>_en`` and a
+    ``<key>_ja`` field below; keep them in step when adding a label.
+    """
+
+    home_en = _label_field('home', 'en')
+    home_ja = _label_field('home', 'ja')
+    events_en = _label_field('events', 'en')
+    events_ja = _label_field('events', 'ja')
+    cleaning_en = _label_field('cleaning', 'en')
+    cleaning_ja = _label_field('cleaning', 'ja')
+    cleaning_short_en = _label_field('cleaning_short', 'en')
+    cleaning_short_ja = _label_field('cleaning_short', 'ja')
+    login_en = _label_field('login', 'en')
+    login_ja = _label_field('login', 'ja')
+    register_en = _label_field('register', 'en')
+    register_ja = _label_field('register', 'ja')
+    logout_en = _label_field('logout', 'en')
+    logout_ja = _label_field('logout', 'ja')
+    browse_events_en = _label_field('browse_events', 'en')
+    browse_events_ja = _label_field('browse_events', 'ja')
+    learn_more_en = _label_field('learn_more', 'en')
+    learn_more_ja = _label_field('learn_more', 'ja')
+
+    class Meta:
+        model = SiteTextSettings
+        fields = ('instagram_url',)
+
+    def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        super().__init__(*args, **kwargs)
+        for key in SiteTextSettings.LABELS:
+            for lang in ('en', 'ja'):
+                self.initial.setdefault(f'{key}_{lang}', self.instance.label(key, lang))
+
+    def save(self, commit=True):  # type: ignore[no-untyped-def]
+        self.instance.labels = {
+            key: {lang: self.cleaned_data[f'{key}_{lang}'] for lang in ('en', 'ja')}
+            for key in SiteTextSettings.LABELS
+        }
+        return super().save(commit)
+
+
+# Label keys per admin section; each key is an en/ja row of the form above.
+_SITE_TEXT_SECTIONS = (
+    ('Navbar labels', ('home', 'events', 'cleaning', 'cleaning_short')),
+    ('Auth labels', ('login', 'register', 'logout')),
+    ('Buttons / CTAs', ('browse_events', 'learn_more')),
+)
 
 
 @admin.register(SiteTextSettings)
 class SiteTextSettingsAdmin(admin.ModelAdmin):
+    form = SiteTextSettingsForm
     list_display = ('updated_at',)
     fieldsets = (
-        ('Navbar labels', {
-            'fields': (
-                ('home_label_en', 'home_label_ja'),
-                ('events_label_en', 'events_label_ja'),
-                ('cleaning_label_en', 'cleaning_label_ja'),
-                ('cleaning_short_en', 'cleaning_short_ja'),
-            )
-        }),
-        ('Auth labels', {
-            'fields': (
-                ('login_en', 'login_ja'),
-                ('register_en', 'register_ja'),
-                ('logout_en', 'logout_ja'),
-            )
-        }),
-        ('Buttons / CTAs', {
-            'fields': (
-                ('browse_events_en', 'browse_events_ja'),
-                ('learn_more_en', 'learn_more_ja'),
-            )
-        }),
+        *(
+            (title, {'fields': tuple((f'{key}_en', f'{key}_ja') for key in keys)})
+            for title, keys in _SITE_TEXT_SECTIONS
+        ),
         ('Social links', {
             'fields': ('instagram_url',),
         }),
@@ -166,17 +251,27 @@ class SiteTextSettingsAdmin(admin.ModelAdmin):
 
 @admin.register(Event)
 class EventAdmin(admin.ModelAdmin):
-    list_display = ('title_en', 'start_datetime', 'location', 'capacity')
+    list_display = ('title_en', 'start_datetime', 'location', 'capacity', 'registrations_count')
     search_fields = ('title_en', 'title_ja', 'location')
     list_filter = ('start_datetime',)
     inlines = [EventImageInline, EventRegistrationInline]
+    readonly_fields = ('all_registrations',)
+
+    def all_registrations(self, obj):  # type: ignore[no-untyped-def]
+        if obj.pk is None:
+            return '-'
+        url = reverse('admin:core_eventregistration_changelist')
+        return format_html('<a href="{}?event__id__exact={}">View all registrations</a>', url, obj.pk)
+    all_registrations.short_description = 'Registrations'
 
 
 @admin.register(EventRegistration)
 class EventRegistrationAdmin(admin.ModelAdmin):
     list_display = ('event', 'user', 'created_at')
+    list_select_related = ('event', 'user')
     search_fields = ('event__title_en', 'user__username')
     list_filter = ('created_at',)
+    show_full_result_count = False
 
 
 class VolunteerMembershipInline(admin.TabularInline):
@@ -184,6 +279,11 @@ class VolunteerMembershipInline(admin.TabularInline):
     extra = 1
     fields = ('user', 'role', 'added_at')
     readonly_fields = ('added_at',)
+    # A plain select would load every user once per membership row.
+    autocomplete_fields = ('user',)
+
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).select_related('user', 'group')
 
 
 @admin.register(VolunteerGroup)
@@ -194,13 +294,16 @@ class VolunteerGroupAdmin(admin.ModelAdmin):
     inlines = [VolunteerMembershipInline]
     fields = ('name', 'description', 'logo', 'active')
 
+    def get_queryset(self, request):  # type: ignore[no-untyped-def]
+        return super().get_queryset(request).annotate(_member_count=Count('memberships'))
+
     def member_count(self, obj):  # type: ignore[no-untyped-def]
-        return obj.memberships.count()
+        return obj._member_count
     member_count.short_description = 'Members'
+    member_count.admin_order_field = '_member_count'
 
     def logo_preview(self, obj):  # type: ignore[no-untyped-def]
         if obj.logo:
-            from django.utils.html import format_html
             return format_html('<img src="{}" style="height:28px;width:auto;border-radius:4px;"/>', obj.logo.url)
         return '-'
     logo_preview.short_description = 'Logo'
@@ -208,10 +311,28 @@ class VolunteerGroupAdmin(admin.ModelAdmin):
 
 @admin.register(Token)
 class TokenAdmin(admin.ModelAdmin):
-    list_display = ('key', 'user', 'created')
-    search_fields = ('key', 'user__username')
+    # ``key`` holds a SHA-256 digest, so it is not worth a column; a pasted
+    # key is matched by hashing it in ``get_search_results``.
+    list_display = ('user', 'created')
+    list_select_related = ('user',)
+    search_fields = ('user__username',)
     readonly_fields = ('key', 'user', 'created')
     list_filter = ('created',)
+    ordering = ('-created',)
+    list_per_page = 25
+    show_full_result_count = False
+    actions = ('revoke_tokens',)
+
+    def get_search_results(self, request, queryset, search_term):  # type: ignore[no-untyped-def]
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term.strip():
+            results |= queryset.filter(key=Token.hash_key(search_term.strip()))
+        return results, may_have_duplicates
+
+    @admin.action(description='Revoke selected tokens (users must log in again)')
+    def revoke_tokens(self, request, queryset):  # type: ignore[no-untyped-def]
+        count, _ = queryset.delete()
+        self.message_user(request, f'Revoked {count} token(s).')
 
 
 @admin.register(ContactMessage)
@@ -219,3 +340,4 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_display = ('name', 'email', 'sent_at')
     search_fields = ('name', 'email', 'message')
     list_filter = ('sent_at',)
+    show_full_result_count = False
@@ -2,8 +2,11 @@
 Core application configuration for the Afrikoop project.
 
 The `CoreConfig` class is automatically discovered by Django and
-configures the name of the app. Additional app specific
-initialisation could be added here in future.
+configures the name of the app. ``ready`` connects the invalidation
+signals of the i18n and token caches and, when the process
+serves HTTP, also loads the admin changelist machinery and the template
+engines, so their imports happen at worker start-up instead of on the
+first admin request.
 """
 from __future__ import annotations
 
@@ -12,4 +15,19 @@ from django.apps import AppConfig
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'core'
\ No newline at end of file
+    name = 'core'
+
+    def ready(self) -> None:
+        from django.conf import settings
+
+        from . import auth_cache, i18n_cache  # noqa: F401  (connect their signal receivers)
+
+        if not getattr(settings, 'SERVES_HTTP', False):
+            return
+        # The URLconf is warmed in wsgi.py; these are the modules
+        # the first admin page view would otherwise still import lazily.
+        import django.contrib.admin.views.main  # noqa: F401
+        from django.template import engines
+
+        # Building the engines imports every registered template tag library.
+        engines.all()
@@ -0,0 +1,100 @@
+"""
+Cache of API token -> user lookups for ``require_token``.
+
+A user is remembered behind a token for ``TTL`` seconds. With
+``REDIS_URL`` configured the entries live in the shared Django cache, and
+deleting a token or saving its user removes them for every worker once
+the transaction commits. Otherwise each worker keeps its own entries in
+memory: deleting a token, or saving its user, forgets it in the process
+that made the change, while other workers keep accepting a revoked token
+until their entry expires, so ``TTL`` is kept short.
+
+Every call returns its own ``User`` instance, so concurrent requests in
+one worker never share a mutable model object.
+"""
+from __future__ import annotations
+
+import copy
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Token
+
+TTL = 30.0
+# Keys come from request headers; cap how many are kept in memory.
+MAX_ENTRIES = 10_000
+
+_SHARED = bool(getattr(settings, 'REDIS_URL', ''))
+
+_users: dict[str, tuple[object, float]] = {}
+
+
+def _cache_key(digest: str) -> str:
+    return f'core:auth:{digest}'
+
+
+def get_user(key: str):  # type: ignore[no-untyped-def]
+    """Return the user owning token ``key``, or ``None`` if it does not exist."""
+    # Entries are keyed by the stored digest so that deleting a token can
+    # forget it, and raw keys are never kept in memory.
+    key = Token.hash_key(key)
+    if _SHARED:
+        # Unpickled on every get, so each request gets a fresh instance.
+        user = cache.get(_cache_key(key))
+        if user is None:
+            user = _lookup(key)
+            if user is not None:
+                cache.set(_cache_key(key), user, TTL)
+        return user
+
+    now = time.monotonic()
+    entry = _users.get(key)
+    if entry is not None and entry[1] > now:
+        return copy.copy(entry[0])
+
+    user = _lookup(key)
+    if user is None:
+        return None
+    if len(_users) >= MAX_ENTRIES:
+        _users.clear()
+    _users[key] = (user, now + TTL)
+    return copy.copy(user)
+
+
+def _lookup(digest: str):  # type: ignore[no-untyped-def]
+    token = Token.objects.select_related('user').filter(key=digest).first()
+    # Unknown keys are not cached: a token created later must work at once.
+    return token.user if token is not None else None
+
+
+def clear() -> None:
+    _users.clear()
+
+
+@receiver(post_delete, sender=Token)
+def _forget_token(sender, instance, **kwargs) -> None:  # type: ignore[no-untyped-def]
+    if _SHARED:
+        key = _cache_key(instance.key)
+        # After commit: earlier, a request could re-cache the still-visible row.
+        transaction.on_commit(lambda: cache.delete(key))
+    _users.pop(instance.key, None)
+
+
+@receiver(post_save, sender=get_user_model())
+def _forget_user(sender, instance, created, **kwargs) -> None:  # type: ignore[no-untyped-def]
+    # A new user has no tokens yet. Deleted users need nothing here: their
+    # tokens are deleted with them and forgotten by ``_forget_token``.
+    if created:
+        return
+    keys = list(Token.objects.filter(user=instance).values_list('key', flat=True))
+    if _SHARED and keys:
+        cache_keys = [_cache_key(key) for key in keys]
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
+    for key in keys:
+        _users.pop(key, None)
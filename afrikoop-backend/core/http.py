@@ -0,0 +1,78 @@
+"""
+JSON encoding for API responses.
+
+``dumps`` serialises with orjson when it is installed (it is listed in
+``requirements.txt``) and falls back to the standard library otherwise.
+Both produce compact UTF-8 bytes. ``JsonResponse`` is a drop-in
+replacement for Django's that encodes through ``dumps``, and
+``require_GET``/``require_POST`` mirror Django's decorators with the
+API's JSON 405 body.
+"""
+from __future__ import annotations
+
+import functools
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _default(obj):  # type: ignore[no-untyped-def]
+    # Whatever orjson cannot encode natively (Decimal, lazy strings, ...)
+    # is handled the way Django's own JsonResponse would.
+    return DjangoJSONEncoder().default(obj)
+
+
+def dumps(data) -> bytes:  # type: ignore[no-untyped-def]
+    """Serialise ``data`` to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default)
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':')).encode()
+
+
+def loads(data: bytes | str):  # type: ignore[no-untyped-def]
+    """Parse JSON from ``bytes`` or ``str``; raises ``ValueError`` on bad input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class JsonResponse(HttpResponse):
+    """``django.http.JsonResponse`` encoded with ``dumps``.
+
+    Same signature as Django's class minus ``encoder`` and
+    ``json_dumps_params``, which have no orjson equivalent.
+    """
+
+    def __init__(self, data, safe: bool = True, **kwargs) -> None:  # type: ignore[no-untyped-def]
+        if safe and not isinstance(data, dict):
+            raise TypeError('In order to allow non-dict objects to be serialized set the safe parameter to False.')
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=dumps(data), **kwargs)
+
+
+def require_http_methods(methods: list[str]):  # type: ignore[no-untyped-def]
+    """Like Django's decorator of the same name, but with a JSON 405 body."""
+    allow = ', '.join(methods)
+
+    def decorator(view_func):  # type: ignore[no-untyped-def]
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):  # type: ignore[no-untyped-def]
+            if request.method not in methods:
+                response = JsonResponse({'detail': 'Method not allowed.'}, status=405)
+                response['Allow'] = allow
+                return response
+            return view_func(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+require_GET = require_http_methods(['GET'])
+require_POST = require_http_methods(['POST'])
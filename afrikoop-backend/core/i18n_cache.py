@@ -0,0 +1,90 @@
+"""
+In-process cache for the i18n bundles served by ``core.views``.
+
+Each worker keeps the strings of a ``(language, namespace)`` pair for
+``TTL`` seconds, together with the serialised JSON body and its ETag.
+Saving or deleting a
+``TranslatableString`` clears the cache of the process that made the
+change straight away; other workers pick the change up when their entry
+expires. Bulk queryset updates bypass the signals and also rely on the
+TTL.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from typing import NamedTuple
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .http import dumps
+from .models import TranslatableString
+
+TTL = 60.0
+# Language and namespace come from the URL; cap how many pairs are kept.
+MAX_ENTRIES = 256
+
+
+class Bundle(NamedTuple):
+    data: dict[str, str]
+    body: bytes
+    etag: str
+    expires: float
+
+
+_bundles: dict[tuple[str, str], Bundle] = {}
+
+
+def get_bundle(lang: str, namespace: str) -> Bundle:
+    """Return the cached bundle for ``lang``/``namespace``, loading it if stale."""
+    return get_bundles(lang, [namespace])[0]
+
+
+def get_bundles(lang: str, namespaces: list[str]) -> list[Bundle]:
+    """Return one bundle per namespace, loading all stale ones in one query."""
+    now = time.monotonic()
+    found: dict[str, Bundle] = {}
+    for ns in namespaces:
+        bundle = _bundles.get((lang, ns))
+        if bundle is not None and bundle.expires > now:
+            found[ns] = bundle
+    missing = [ns for ns in dict.fromkeys(namespaces) if ns not in found]
+    if missing:
+        found.update(_load(lang, missing, now))
+    return [found[ns] for ns in namespaces]
+
+
+def _load(lang: str, namespaces: list[str], now: float) -> dict[str, Bundle]:
+    qs = TranslatableString.objects.filter(language=lang)
+    data: dict[str, dict[str, str]]
+    if len(namespaces) == 1:
+        # The per-namespace endpoint: build the mapping straight from (key, text) tuples.
+        ns = namespaces[0]
+        data = {ns: dict(qs.filter(namespace=ns).values_list('key', 'text'))}
+    else:
+        data = {ns: {} for ns in namespaces}
+        for ns, key, text in qs.filter(namespace__in=namespaces).values_list('namespace', 'key', 'text'):
+            data[ns][key] = text
+
+    if len(_bundles) + len(namespaces) > MAX_ENTRIES:
+        _bundles.clear()
+    loaded = {}
+    for ns, strings in data.items():
+        body = dumps(strings)
+        etag = '"%s"' % hashlib.md5(body, usedforsecurity=False).hexdigest()
+        loaded[ns] = Bundle(strings, body, etag, now + TTL)
+        # A single request may name more namespaces than the cap allows.
+        if len(_bundles) < MAX_ENTRIES:
+            _bundles[(lang, ns)] = loaded[ns]
+    return loaded
+
+
+def clear() -> None:
+    _bundles.clear()
+
+
+@receiver(post_save, sender=TranslatableString)
+@receiver(post_delete, sender=TranslatableString)
+def _invalidate(**kwargs) -> None:  # type: ignore[no-untyped-def]
+    clear()
@@ -0,0 +1,26 @@
+"""
+Lazy wrapper around ``django-cors-headers``' middleware.
+
+Listing ``corsheaders.middleware.CorsMiddleware`` in ``MIDDLEWARE``
+imports the package in every process that loads the handler. This shim
+defers that import until the first request actually passes through it,
+so management commands and other non-HTTP processes never pay for it.
+"""
+from __future__ import annotations
+
+from django.http import HttpRequest
+
+
+class LazyCorsMiddleware:
+    """Instantiate ``CorsMiddleware`` on first use and delegate to it."""
+
+    def __init__(self, get_response):  # type: ignore[no-untyped-def]
+        self._get_response = get_response
+        self._real = None
+
+    def __call__(self, request: HttpRequest):  # type: ignore[no-untyped-def]
+        if self._real is None:
+            from corsheaders.middleware import CorsMiddleware
+
+            self._real = CorsMiddleware(self._get_response)
+        return self._real(request)
@@ -0,0 +1,48 @@
+"""
+Import ``TranslatableString`` rows from a JSON file.
+
+The file maps language to namespace to key, i.e. the shape of the
+per-namespace i18n endpoint nested under its language and namespace::
+
+    {"en": {"common": {"home": "Home"}}, "ja": {"common": {"home": "ホーム"}}}
+
+Existing strings are updated in place and new ones created, in batches.
+"""
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import TranslatableString
+
+
+class Command(BaseCommand):
+    help = 'Create or update translatable strings from a {lang: {namespace: {key: text}}} JSON file.'
+
+    def add_arguments(self, parser):  # type: ignore[no-untyped-def]
+        parser.add_argument('path', help='JSON file to import.')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):  # type: ignore[no-untyped-def]
+        try:
+            with open(options['path'], encoding='utf-8') as fh:
+                data = json.load(fh)
+        except (OSError, ValueError) as exc:
+            raise CommandError(f'Could not read {options["path"]}: {exc}') from exc
+
+        languages = dict(TranslatableString.LANG_CHOICES)
+        unknown = sorted(set(data) - set(languages))
+        if unknown:
+            raise CommandError(f'Unknown language(s): {", ".join(unknown)}')
+
+        rows = [
+            {'language': lang, 'namespace': namespace, 'key': key, 'text': text}
+            for lang, namespaces in data.items()
+            for namespace, strings in namespaces.items()
+            for key, text in strings.items()
+        ]
+        with transaction.atomic():
+            count = TranslatableString.bulk_upsert(rows, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Imported {count} strings.'))
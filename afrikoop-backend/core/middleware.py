@@ -0,0 +1,36 @@
+"""
+Session, authentication and message middleware that skip the JSON API.
+
+The API under ``/api/`` authenticates with tokens and never reads the
+session or queues messages, yet the stock middlewares still wrap every
+API request. These subclasses pass ``/api/`` requests straight through
+and behave exactly like their parents everywhere else, so the admin
+keeps working (and its system checks still recognise them).
+"""
+from __future__ import annotations
+
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.http import HttpRequest
+
+API_PATH_PREFIX = '/api/'
+
+
+class _SkipApiMixin:
+    def __call__(self, request: HttpRequest):  # type: ignore[no-untyped-def]
+        if request.path_info.startswith(API_PATH_PREFIX):
+            return self.get_response(request)  # type: ignore[attr-defined]
+        return super().__call__(request)  # type: ignore[misc]
+
+
+class NonApiSessionMiddleware(_SkipApiMixin, SessionMiddleware):
+    pass
+
+
+class NonApiAuthenticationMiddleware(_SkipApiMixin, AuthenticationMiddleware):
+    pass
+
+
+class NonApiMessageMiddleware(_SkipApiMixin, MessageMiddleware):
+    pass
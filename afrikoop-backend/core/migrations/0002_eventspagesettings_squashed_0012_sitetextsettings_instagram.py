@@ -0,0 +1,190 @@
+# Generated by Django 5.2.6 on 2026-10-15 07:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    replaces = [('core', '0002_eventspagesettings'), ('core', '0003_eventplaceholder'), ('core', '0004_cleaning_extras'), ('core', '0005_eventimage'), ('core', '0006_cleaning_gallery'), ('core', '0007_alter_cleaningfeature_color'), ('core', '0008_volunteertier'), ('core', '0009_sitetextsettings'), ('core', '0010_volunteergroup_membership'), ('core', '0011_volunteergroup_logo'), ('core', '0012_sitetextsettings_instagram')]
+
+    dependencies = [
+        ('core', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventsPageSettings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title_en', models.CharField(blank=True, default='Upcoming Events', max_length=200)),
+                ('title_ja', models.CharField(blank=True, default='イベント情報', max_length=200)),
+                ('subtitle_en', models.TextField(blank=True, default='Join community gatherings, volunteer days, and workshops. New dates drop regularly — check back soon!')),
+                ('subtitle_ja', models.TextField(blank=True, default='コミュニティイベント、ボランティア、ワークショップなど。最新情報をお見逃しなく！')),
+                ('hero_image', models.ImageField(blank=True, upload_to='events/')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Events Page Settings',
+                'verbose_name_plural': 'Events Page Settings',
+            },
+        ),
+        migrations.CreateModel(
+            name='EventPlaceholder',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title_en', models.CharField(max_length=200)),
+                ('title_ja', models.CharField(blank=True, max_length=200)),
+                ('description_en', models.TextField(blank=True)),
+                ('description_ja', models.TextField(blank=True)),
+                ('image', models.ImageField(blank=True, upload_to='events/placeholders/')),
+                ('cta_label_en', models.CharField(blank=True, max_length=100)),
+                ('cta_label_ja', models.CharField(blank=True, max_length=100)),
+                ('cta_url', models.URLField(blank=True)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('active', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='placeholders', to='core.eventspagesettings')),
+            ],
+            options={
+                'ordering': ['order', 'id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='cleaningservicepage',
+            name='cta_en',
+            field=models.CharField(blank=True, default='Tell us your schedule and property details — we’ll get back with a quote.', max_length=200),
+        ),
+        migrations.AddField(
+            model_name='cleaningservicepage',
+            name='cta_ja',
+            field=models.CharField(blank=True, default='日程と物件情報をお知らせください。お見積もりをご連絡します。', max_length=200),
+        ),
+        migrations.AlterModelOptions(
+            name='event',
+            options={'ordering': ['-start_datetime']},
+        ),
+        migrations.CreateModel(
+            name='EventImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='events/images/')),
+                ('caption_en', models.CharField(blank=True, max_length=200)),
+                ('caption_ja', models.CharField(blank=True, max_length=200)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='core.event')),
+            ],
+            options={
+                'ordering': ['order', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CleaningGalleryImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='cleaning/gallery/')),
+                ('caption_en', models.CharField(blank=True, max_length=200)),
+                ('caption_ja', models.CharField(blank=True, max_length=200)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gallery_images', to='core.cleaningservicepage')),
+            ],
+            options={
+                'ordering': ['order', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CleaningFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text_en', models.CharField(max_length=200)),
+                ('text_ja', models.CharField(blank=True, max_length=200)),
+                ('color', models.CharField(blank=True, choices=[('primary', 'Primary (Magenta/Rose)'), ('accent', 'Accent (Gold)'), ('secondary', 'Secondary (Teal)')], help_text='Optional brand color for the bullet dot. Leave blank to use Primary.', max_length=20)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='features', to='core.cleaningservicepage')),
+            ],
+            options={
+                'ordering': ['order', 'id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='VolunteerTier',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('slug', models.SlugField(blank=True, max_length=120, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('priority', models.PositiveIntegerField(default=0, help_text='Smaller number appears first')),
+                ('active', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('members', models.ManyToManyField(blank=True, related_name='volunteer_tiers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Volunteer Tier',
+                'verbose_name_plural': 'Volunteer Tiers',
+                'ordering': ['priority', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='VolunteerGroup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('active', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('logo', models.ImageField(blank=True, upload_to='volunteers/groups/')),
+            ],
+            options={
+                'verbose_name': 'Volunteer Group',
+                'verbose_name_plural': 'Volunteer Groups',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='VolunteerMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('member', 'Member'), ('lead', 'Lead'), ('coordinator', 'Coordinator')], default='member', max_length=20)),
+                ('added_at', models.DateTimeField(auto_now_add=True)),
+                ('group', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='core.volunteergroup')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='volunteer_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Volunteer Membership',
+                'verbose_name_plural': 'Volunteer Memberships',
+                'unique_together': {('user', 'group')},
+            },
+        ),
+        migrations.CreateModel(
+            name='SiteTextSettings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('home_label_en', models.CharField(blank=True, default='Home', max_length=50)),
+                ('home_label_ja', models.CharField(blank=True, default='ホーム', max_length=50)),
+                ('events_label_en', models.CharField(blank=True, default='Events', max_length=50)),
+                ('events_label_ja', models.CharField(blank=True, default='イベント', max_length=50)),
+                ('cleaning_label_en', models.CharField(blank=True, default='Cleaning Service', max_length=50)),
+                ('cleaning_label_ja', models.CharField(blank=True, default='清掃サービス', max_length=50)),
+                ('cleaning_short_en', models.CharField(blank=True, default='Cleaning', max_length=50)),
+                ('cleaning_short_ja', models.CharField(blank=True, default='清掃', max_length=50)),
+                ('login_en', models.CharField(blank=True, default='Login', max_length=50)),
+                ('login_ja', models.CharField(blank=True, default='ログイン', max_length=50)),
+                ('register_en', models.CharField(blank=True, default='Register', max_length=50)),
+                ('register_ja', models.CharField(blank=True, default='登録', max_length=50)),
+                ('logout_en', models.CharField(blank=True, default='Logout', max_length=50)),
+                ('logout_ja', models.CharField(blank=True, default='ログアウト', max_length=50)),
+                ('browse_events_en', models.CharField(blank=True, default='Browse events', max_length=60)),
+                ('browse_events_ja', models.CharField(blank=True, default='イベントを見る', max_length=60)),
+                ('learn_more_en', models.CharField(blank=True, default='Learn more', max_length=60)),
+                ('learn_more_ja', models.CharField(blank=True, default='詳しく見る', max_length=60)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('instagram_url', models.URLField(blank=True, help_text='Full URL to your Instagram profile (e.g., https://instagram.com/yourhandle)')),
+            ],
+            options={
+                'verbose_name': 'Site Text Settings',
+                'verbose_name_plural': 'Site Text Settings',
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+from core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('core', '0002_eventspagesettings_squashed_0012_sitetextsettings_instagram'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='eventplaceholder',
+            index=models.Index(fields=['page', 'order', 'id'], name='core_evtph_page_ord_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='eventimage',
+            index=models.Index(fields=['event', 'order', 'id'], name='core_evtimg_event_ord_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='cleaningfeature',
+            index=models.Index(fields=['page', 'order', 'id'], name='core_clnfeat_page_ord_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='cleaninggalleryimage',
+            index=models.Index(fields=['page', 'order', 'id'], name='core_clngal_page_ord_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+from core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('core', '0013_child_order_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='volunteermembership',
+            index=models.Index(fields=['group', 'role', 'user'], name='core_vm_grp_role_usr_idx'),
+        ),
+    ]
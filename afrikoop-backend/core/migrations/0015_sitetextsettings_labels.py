@@ -0,0 +1,58 @@
+from django.db import migrations, models
+
+import core.models
+
+# Label key -> column prefix used before the labels moved into JSON.
+_COLUMN_PREFIXES = {
+    'home': 'home_label',
+    'events': 'events_label',
+    'cleaning': 'cleaning_label',
+    'cleaning_short': 'cleaning_short',
+    'login': 'login',
+    'register': 'register',
+    'logout': 'logout',
+    'browse_events': 'browse_events',
+    'learn_more': 'learn_more',
+}
+
+
+def columns_to_labels(apps, schema_editor):
+    SiteTextSettings = apps.get_model('core', 'SiteTextSettings')
+    for row in SiteTextSettings.objects.using(schema_editor.connection.alias):
+        labels = {
+            key: {lang: getattr(row, f'{prefix}_{lang}') for lang in ('en', 'ja')}
+            for key, prefix in _COLUMN_PREFIXES.items()
+        }
+        # update() rather than save() so updated_at is left alone.
+        SiteTextSettings.objects.using(schema_editor.connection.alias).filter(pk=row.pk).update(labels=labels)
+
+
+def labels_to_columns(apps, schema_editor):
+    SiteTextSettings = apps.get_model('core', 'SiteTextSettings')
+    defaults = core.models.default_site_labels()
+    for row in SiteTextSettings.objects.using(schema_editor.connection.alias):
+        values = {
+            f'{prefix}_{lang}': (row.labels.get(key) or {}).get(lang, defaults[key][lang])
+            for key, prefix in _COLUMN_PREFIXES.items()
+            for lang in ('en', 'ja')
+        }
+        SiteTextSettings.objects.using(schema_editor.connection.alias).filter(pk=row.pk).update(**values)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0014_volunteermembership_group_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitetextsettings',
+            name='labels',
+            field=models.JSONField(blank=True, default=core.models.default_site_labels),
+        ),
+        migrations.RunPython(columns_to_labels, labels_to_columns),
+    ] + [
+        migrations.RemoveField(model_name='sitetextsettings', name=f'{prefix}_{lang}')
+        for prefix in _COLUMN_PREFIXES.values()
+        for lang in ('en', 'ja')
+    ]
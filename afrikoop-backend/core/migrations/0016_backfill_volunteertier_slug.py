@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def backfill_slugs(apps, schema_editor):
+    """Give every tier without a slug the one ``VolunteerTier.save()`` would."""
+    from django.utils.text import slugify
+
+    VolunteerTier = apps.get_model('core', 'VolunteerTier')
+    tiers = list(VolunteerTier.objects.using(schema_editor.connection.alias).filter(slug='').only('pk', 'name'))
+    for tier in tiers:
+        tier.slug = slugify(tier.name)
+    VolunteerTier.objects.using(schema_editor.connection.alias).bulk_update(tiers, ['slug'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0015_sitetextsettings_labels'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_slugs, migrations.RunPython.noop),
+    ]
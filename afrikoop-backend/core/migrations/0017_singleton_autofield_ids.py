@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0016_backfill_volunteertier_slug'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='eventspagesettings',
+            name='id',
+            field=models.AutoField(primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='sitetextsettings',
+            name='id',
+            field=models.AutoField(primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+from core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ('core', '0017_singleton_autofield_ids'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='contactmessage',
+            index=models.Index(fields=['-sent_at'], name='core_contact_sent_desc_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='event',
+            index=models.Index(fields=['start_datetime'], name='core_event_start_idx'),
+        ),
+        # Replaces the single-column indexes dropped in 0022.
+        AddIndexConcurrently(
+            model_name='translatablestring',
+            index=models.Index(fields=['language', 'namespace', 'key'], name='core_ts_lang_ns_key_idx'),
+        ),
+    ]
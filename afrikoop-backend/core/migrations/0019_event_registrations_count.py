@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def backfill_counts(apps, schema_editor):
+    """Store each event's current number of registrations in one UPDATE."""
+    from django.db.models import Count, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+
+    Event = apps.get_model('core', 'Event')
+    EventRegistration = apps.get_model('core', 'EventRegistration')
+    counts = (
+        EventRegistration.objects.filter(event=OuterRef('pk'))
+        .order_by()
+        .values('event')
+        .annotate(n=Count('pk'))
+        .values('n')
+    )
+    Event.objects.using(schema_editor.connection.alias).update(
+        registrations_count=Coalesce(Subquery(counts), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0018_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='registrations_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
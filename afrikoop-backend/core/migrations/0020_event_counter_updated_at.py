@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0019_event_registrations_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='counter_updated_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+    ]
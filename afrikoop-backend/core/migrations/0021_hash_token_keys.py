@@ -0,0 +1,41 @@
+"""
+Store API token keys as their SHA-256 hex digest.
+
+Irreversible: a digest cannot be turned back into the key a client
+holds, so migrating below this point requires deleting the tokens by
+hand (every user then logs in again).
+"""
+import hashlib
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+# Keeps each UPDATE well under SQLite's bound-parameter limit.
+BATCH_SIZE = 500
+
+
+def hash_keys(apps, schema_editor):
+    """Replace every stored token key with its digest, one UPDATE per batch."""
+    Token = apps.get_model('core', 'Token')
+    tokens = Token.objects.using(schema_editor.connection.alias)
+    keys = list(tokens.values_list('key', flat=True))
+    for start in range(0, len(keys), BATCH_SIZE):
+        batch = keys[start:start + BATCH_SIZE]
+        tokens.filter(key__in=batch).update(key=Case(
+            *(When(key=key, then=Value(hashlib.sha256(key.encode()).hexdigest())) for key in batch),
+        ))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0020_event_counter_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='token',
+            name='key',
+            field=models.CharField(max_length=64, primary_key=True, serialize=False),
+        ),
+        migrations.RunPython(hash_keys, elidable=False),
+    ]
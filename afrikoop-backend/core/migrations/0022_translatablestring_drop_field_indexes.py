@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Kept apart from 0018, which must run outside a transaction, so a
+    # failure here rolls back cleanly.
+
+    dependencies = [
+        ('core', '0021_hash_token_keys'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='translatablestring',
+            name='key',
+            field=models.CharField(help_text='Identifier used in the frontend, e.g. t("home") → key "home".', max_length=100),
+        ),
+        migrations.AlterField(
+            model_name='translatablestring',
+            name='language',
+            field=models.CharField(choices=[('en', 'English'), ('ja', '日本語')], help_text='Language of this text.', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='translatablestring',
+            name='namespace',
+            field=models.CharField(default='common', help_text='Logical group for strings, e.g. "common", "navbar", "home".', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='translatablestring',
+            name='text',
+            field=models.TextField(help_text='Translated text to display in the UI.'),
+        ),
+    ]
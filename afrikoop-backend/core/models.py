@@ -11,20 +11,91 @@ frontend, views can select the appropriate language based on the
 """
 from __future__ import annotations
 
+import hashlib
 import secrets
-import string
+import time
 from datetime import datetime
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
 from django.utils import timezone
 from django.utils.text import slugify
 
 User = get_user_model()
 
 
-class MissionPage(models.Model):
+class WithChildrenManager(models.Manager):
+    """Manager whose querysets prefetch a model's child relations.
+
+    Parent models expose it as ``with_children`` next to the plain
+    ``objects`` manager, so listing code can load parents and children
+    in a fixed number of queries without repeating the lookups.
+    """
+
+    def __init__(self, *lookups: str) -> None:
+        super().__init__()
+        self.lookups = lookups
+
+    def get_queryset(self) -> models.QuerySet:
+        return super().get_queryset().prefetch_related(*self.lookups)
+
+
+_MISSING = object()
+
+
+class SingletonSettingsMixin:
+    """Cached ``current()`` accessor for single-row content models.
+
+    ``current()`` returns the first row (with its children when the model
+    has a ``with_children`` manager; give a model one only if the cached
+    row's children are read), or ``None`` if none exists, and
+    keeps it in the default cache for ``CURRENT_CACHE_TIMEOUT`` seconds
+    under the model's ``current_version()``. Saving or deleting the row,
+    or one of its children, moves the model to a new version once the
+    transaction commits (see ``_clear_cached_current``).
+    """
+
+    CURRENT_CACHE_TIMEOUT = 60
+
+    @classmethod
+    def _current_version_key(cls) -> str:
+        return f'core:current:version:{cls._meta.label_lower}'  # type: ignore[attr-defined]
+
+    @classmethod
+    def current_version(cls) -> int:
+        """Return the version that the cached ``current()`` row is stored under."""
+        key = cls._current_version_key()
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), None)
+            version = cache.get(key, 0)
+        return version
+
+    @classmethod
+    def current(cls):  # type: ignore[no-untyped-def]
+        key = f'core:current:{cls._meta.label_lower}:{cls.current_version()}'  # type: ignore[attr-defined]
+        obj = cache.get(key, _MISSING)
+        if obj is _MISSING:
+            manager = getattr(cls, 'with_children', None) or cls.objects  # type: ignore[attr-defined]
+            obj = manager.first()
+            cache.set(key, obj, cls.CURRENT_CACHE_TIMEOUT)
+        return obj
+
+    @classmethod
+    def clear_current(cls) -> None:
+        key = cls._current_version_key()
+        # A new version rather than a delete: a request that read the old
+        # row before the commit can only store it under the old version.
+        # A fresh timestamp rather than incr(), so a re-created key never
+        # matches a version that older entries are still stored under.
+        transaction.on_commit(lambda: cache.set(key, time.time_ns(), None))
+
+
+class MissionPage(SingletonSettingsMixin, models.Model):
     """Model representing the mission statement of the coop.
 
     Only a single instance is typically used, but the model does not
@@ -49,7 +120,7 @@ class MissionPage(models.Model):
         return self.title_en or 'Mission'
 
 
-class CleaningServicePage(models.Model):
+class CleaningServicePage(SingletonSettingsMixin, models.Model):
     """Model representing information about the cleaning service.
 
     Similar to ``MissionPage``, translations for the title and body
@@ -67,6 +138,9 @@ class CleaningServicePage(models.Model):
     cta_en = models.CharField(max_length=200, blank=True, default='Tell us your schedule and property details — we’ll get back with a quote.')
     cta_ja = models.CharField(max_length=200, blank=True, default='日程と物件情報をお知らせください。お見積もりをご連絡します。')
 
+    objects = models.Manager()
+    with_children = WithChildrenManager('features', 'gallery_images')
+
     class Meta:
         verbose_name = 'Cleaning Service Page'
         verbose_name_plural = 'Cleaning Service Pages'
@@ -90,11 +164,21 @@ class Event(models.Model):
     start_datetime = models.DateTimeField()
     location = models.CharField(max_length=200, blank=True)
     capacity = models.PositiveIntegerField(null=True, blank=True)
+    # Kept in step with ``registrations`` by the signal receivers at the
+    # bottom of this module; never edit by hand.
+    registrations_count = models.PositiveIntegerField(default=0, editable=False)
+    # When the counter last moved; ``updated_at`` keeps tracking edits only,
+    # since the counter is written with ``update()``.
+    counter_updated_at = models.DateTimeField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    with_children = WithChildrenManager('images')
+
     class Meta:
         ordering = ['-start_datetime']
+        indexes = [models.Index(fields=['start_datetime'], name='core_event_start_idx')]
 
     def __str__(self) -> str:
         return self.title_en
@@ -104,12 +188,11 @@ class Event(models.Model):
         """Return the number of remaining slots or ``None`` if unlimited."""
         if self.capacity is None:
             return None
-        taken = self.registrations.count()
-        return max(self.capacity - taken, 0)
+        return max(self.capacity - self.registrations_count, 0)
 
     def is_full(self) -> bool:
         """Return True if the event capacity has been reached."""
-        return self.capacity is not None and self.registrations.count() >= self.capacity
+        return self.capacity is not None and self.registrations_count >= self.capacity
 
 
 class EventRegistration(models.Model):
@@ -139,9 +222,13 @@ class Token(models.Model):
     associated with a user. Clients must send the token in an
     ``Authorization: Token <key>`` header when accessing protected
     endpoints.
+
+    Only the SHA-256 digest of the key is stored (see ``hash_key``); the
+    key itself is handed to the client once, as ``raw_key`` on the
+    instance returned by ``create``.
     """
 
-    key = models.CharField(max_length=40, primary_key=True)
+    key = models.CharField(max_length=64, primary_key=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='auth_tokens')
     created = models.DateTimeField(auto_now_add=True)
 
@@ -154,16 +241,29 @@ class Token(models.Model):
 
     @staticmethod
     def generate_key(length: int = 40) -> str:
-        """Generate a cryptographically secure random key."""
-        alphabet = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        """Generate a cryptographically secure random key.
+
+        URL-safe base64 of a single ``token_bytes`` draw (about six bits of
+        entropy per character), instead of one RNG call per character.
+        """
+        return secrets.token_urlsafe(length)[:length]
+
+    @staticmethod
+    def hash_key(key: str) -> str:
+        """Return the stored form of ``key``: its SHA-256 hex digest."""
+        return hashlib.sha256(key.encode()).hexdigest()
 
     @classmethod
     def create(cls, user: User) -> 'Token':
         """Create and return a new token for a user, deleting old tokens."""
-        cls.objects.filter(user=user).delete()
-        key = cls.generate_key()
-        token = cls.objects.create(key=key, user=user)
+        raw_key = cls.generate_key()
+        token = cls(key=cls.hash_key(raw_key), user=user)
+        token.raw_key = raw_key
+        # One transaction, so the user is never left without a token (or
+        # with both) if the insert fails.
+        with transaction.atomic():
+            cls.objects.filter(user=user).delete()
+            token.save(force_insert=True)
         return token
 
 
@@ -182,6 +282,7 @@ class ContactMessage(models.Model):
 
     class Meta:
         ordering = ['-sent_at']
+        indexes = [models.Index(fields=['-sent_at'], name='core_contact_sent_desc_idx')]
 
     def __str__(self) -> str:
         return f'Message from {self.name} ({self.email})'
@@ -205,18 +306,15 @@ class TranslatableString(models.Model):
     namespace = models.CharField(
         max_length=50,
         default='common',
-        db_index=True,
         help_text='Logical group for strings, e.g. "common", "navbar", "home".',
     )
     key = models.CharField(
         max_length=100,
-        db_index=True,
         help_text='Identifier used in the frontend, e.g. t("home") → key "home".',
     )
     language = models.CharField(
         max_length=10,
         choices=LANG_CHOICES,
-        db_index=True,
         help_text='Language of this text.',
     )
     text = models.TextField(help_text='Translated text to display in the UI.')
@@ -224,6 +322,8 @@ class TranslatableString(models.Model):
 
     class Meta:
         unique_together = ('namespace', 'key', 'language')
+        # Matches the i18n views' filter on (language, namespace).
+        indexes = [models.Index(fields=['language', 'namespace', 'key'], name='core_ts_lang_ns_key_idx')]
         ordering = ['namespace', 'key', 'language']
         verbose_name = 'Translatable String'
         verbose_name_plural = 'Translatable Strings'
@@ -231,8 +331,29 @@ class TranslatableString(models.Model):
     def __str__(self) -> str:  # pragma: no cover - human readable only
         return f'[{self.language}] {self.namespace}:{self.key}'
 
-
-class EventsPageSettings(models.Model):
+    @classmethod
+    def bulk_upsert(cls, rows, batch_size: int = 5000) -> int:  # type: ignore[no-untyped-def]
+        """Insert or update ``rows`` of ``namespace``/``key``/``language``/``text``.
+
+        Uses one ``INSERT ... ON CONFLICT DO UPDATE`` per batch instead of a
+        query per string. Like every bulk write it sends no signals, so
+        cached i18n bundles refresh only when their TTL expires.
+        """
+        objs = [
+            cls(namespace=row.get('namespace') or 'common', key=row['key'], language=row['language'], text=row['text'])
+            for row in rows
+        ]
+        cls.objects.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['namespace', 'key', 'language'],
+            update_fields=['text', 'updated_at'],
+        )
+        return len(objs)
+
+
+class EventsPageSettings(SingletonSettingsMixin, models.Model):
     """Configurable content for the Events page hero.
 
     Provides replaceable text and imagery via Django admin so the
@@ -240,6 +361,8 @@ class EventsPageSettings(models.Model):
     upcoming events.
     """
 
+    # Single-row table; a 4-byte key is plenty.
+    id = models.AutoField(primary_key=True)
     title_en = models.CharField(max_length=200, blank=True, default='Upcoming Events')
     title_ja = models.CharField(max_length=200, blank=True, default='イベント情報')
     subtitle_en = models.TextField(blank=True, default='Join community gatherings, volunteer days, and workshops. New dates drop regularly — check back soon!')
@@ -277,6 +400,7 @@ class EventPlaceholder(models.Model):
 
     class Meta:
         ordering = ['order', 'id']
+        indexes = [models.Index(fields=['page', 'order', 'id'], name='core_evtph_page_ord_idx')]
 
     def __str__(self) -> str:  # pragma: no cover
         return self.title_en
@@ -293,6 +417,7 @@ class EventImage(models.Model):
 
     class Meta:
         ordering = ['order', 'id']
+        indexes = [models.Index(fields=['event', 'order', 'id'], name='core_evtimg_event_ord_idx')]
 
     def __str__(self) -> str:  # pragma: no cover
         return f'Image for {self.event.title_en}'
@@ -324,6 +449,7 @@ class CleaningFeature(models.Model):
 
     class Meta:
         ordering = ['order', 'id']
+        indexes = [models.Index(fields=['page', 'order', 'id'], name='core_clnfeat_page_ord_idx')]
 
     def __str__(self) -> str:  # pragma: no cover
         return self.text_en
@@ -340,6 +466,7 @@ class CleaningGalleryImage(models.Model):
 
     class Meta:
         ordering = ['order', 'id']
+        indexes = [models.Index(fields=['page', 'order', 'id'], name='core_clngal_page_ord_idx')]
 
     def __str__(self) -> str:  # pragma: no cover
         return self.caption_en or f'Gallery image #{self.pk}'
@@ -386,6 +513,9 @@ class VolunteerGroup(models.Model):
     active = models.BooleanField(default=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    with_children = WithChildrenManager('memberships')
+
     class Meta:
         ordering = ['name']
         verbose_name = 'Volunteer Group'
@@ -411,6 +541,8 @@ class VolunteerMembership(models.Model):
 
     class Meta:
         unique_together = ('user', 'group')
+        # The unique index leads with user; group-side lookups need their own.
+        indexes = [models.Index(fields=['group', 'role', 'user'], name='core_vm_grp_role_usr_idx')]
         verbose_name = 'Volunteer Membership'
         verbose_name_plural = 'Volunteer Memberships'
 
@@ -418,37 +550,41 @@ class VolunteerMembership(models.Model):
         return f'{self.user} @ {self.group} ({self.get_role_display()})'
 
 
-class SiteTextSettings(models.Model):
+def default_site_labels() -> dict[str, dict[str, str]]:
+    """Return the bundled label texts, shaped like ``SiteTextSettings.labels``."""
+    return {key: {'en': en, 'ja': ja} for key, (_, en, ja) in SiteTextSettings.LABELS.items()}
+
+
+class SiteTextSettings(SingletonSettingsMixin, models.Model):
     """Friendly, one‑page UI text editor for admins.
 
-    These fields map to common UI labels used by the frontend. If a
-    value is left blank the app falls back to defaults bundled in the
-    frontend. Keep values short (labels/buttons).
+    The labels map to common UI strings used by the frontend and are
+    stored together in ``labels`` as ``{key: {'en': ..., 'ja': ...}}``,
+    so adding a label does not need a schema change. If a value is left
+    blank the app falls back to defaults bundled in the frontend. Keep
+    values short (labels/buttons).
     """
 
-    # Navbar / basic
-    home_label_en = models.CharField(max_length=50, blank=True, default='Home')
-    home_label_ja = models.CharField(max_length=50, blank=True, default='ホーム')
-    events_label_en = models.CharField(max_length=50, blank=True, default='Events')
-    events_label_ja = models.CharField(max_length=50, blank=True, default='イベント')
-    cleaning_label_en = models.CharField(max_length=50, blank=True, default='Cleaning Service')
-    cleaning_label_ja = models.CharField(max_length=50, blank=True, default='清掃サービス')
-    cleaning_short_en = models.CharField(max_length=50, blank=True, default='Cleaning')
-    cleaning_short_ja = models.CharField(max_length=50, blank=True, default='清掃')
-
-    # Auth
-    login_en = models.CharField(max_length=50, blank=True, default='Login')
-    login_ja = models.CharField(max_length=50, blank=True, default='ログイン')
-    register_en = models.CharField(max_length=50, blank=True, default='Register')
-    register_ja = models.CharField(max_length=50, blank=True, default='登録')
-    logout_en = models.CharField(max_length=50, blank=True, default='Logout')
-    logout_ja = models.CharField(max_length=50, blank=True, default='ログアウト')
-
-    # Buttons / CTAs
-    browse_events_en = models.CharField(max_length=60, blank=True, default='Browse events')
-    browse_events_ja = models.CharField(max_length=60, blank=True, default='イベントを見る')
-    learn_more_en = models.CharField(max_length=60, blank=True, default='Learn more')
-    learn_more_ja = models.CharField(max_length=60, blank=True, default='詳しく見る')
+    # Single-row table; a 4-byte key is plenty.
+    id = models.AutoField(primary_key=True)
+
+    # Label key -> (max length, English default, Japanese default).
+    LABELS: dict[str, tuple[int, str, str]] = {
+        # Navbar / basic
+        'home': (50, 'Home', 'ホーム'),
+        'events': (50, 'Events', 'イベント'),
+        'cleaning': (50, 'Cleaning Service', '清掃サービス'),
+        'cleaning_short': (50, 'Cleaning', '清掃'),
+        # Auth
+        'login': (50, 'Login', 'ログイン'),
+        'register': (50, 'Register', '登録'),
+        'logout': (50, 'Logout', 'ログアウト'),
+        # Buttons / CTAs
+        'browse_events': (60, 'Browse events', 'イベントを見る'),
+        'learn_more': (60, 'Learn more', '詳しく見る'),
+    }
+
+    labels = models.JSONField(default=default_site_labels, blank=True)
 
     # Social links
     instagram_url = models.URLField(blank=True, help_text='Full URL to your Instagram profile (e.g., https://instagram.com/yourhandle)')
@@ -461,3 +597,56 @@ class SiteTextSettings(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover
         return 'Site Text Settings'
+
+    def label(self, key: str, lang: str) -> str:
+        """Return label ``key`` in ``lang`` (``en``/``ja``), or its bundled default."""
+        _, en, ja = self.LABELS[key]
+        return (self.labels.get(key) or {}).get(lang, ja if lang == 'ja' else en)
+
+    def labels_for(self, lang: str) -> dict[str, str]:
+        """Return every label in ``lang`` as a flat ``{key: text}`` mapping."""
+        return {key: self.label(key, lang) for key in self.LABELS}
+
+
+def _clear_cached_current(sender, instance, **kwargs) -> None:  # type: ignore[no-untyped-def]
+    if isinstance(instance, SingletonSettingsMixin):
+        instance.clear_current()
+    else:
+        # Use the model class: the parent row may already be gone (cascade).
+        sender.page.field.related_model.clear_current()
+
+
+def _count_registration(sender, instance, created, raw=False, **kwargs) -> None:  # type: ignore[no-untyped-def]
+    if created and not raw:
+        Event.objects.filter(pk=instance.event_id).update(
+            registrations_count=F('registrations_count') + 1, counter_updated_at=timezone.now()
+        )
+
+
+def _uncount_registration(sender, instance, origin=None, **kwargs) -> None:  # type: ignore[no-untyped-def]
+    # Deleting the event cascades to its registrations; its row is going too.
+    if isinstance(origin, Event) or getattr(origin, 'model', None) is Event:
+        return
+    Event.objects.filter(pk=instance.event_id, registrations_count__gt=0).update(
+        registrations_count=F('registrations_count') - 1, counter_updated_at=timezone.now()
+    )
+
+
+post_save.connect(_count_registration, sender=EventRegistration)
+post_delete.connect(_uncount_registration, sender=EventRegistration)
+
+
+# Signals rather than save()/delete() overrides, so admin bulk deletes and
+# cascades invalidate too. Connected per model: a sender-less receiver
+# would stop Django fast-deleting every other model.
+for _model in (
+    MissionPage,
+    CleaningServicePage,
+    CleaningFeature,
+    CleaningGalleryImage,
+    EventsPageSettings,
+    EventPlaceholder,
+    SiteTextSettings,
+):
+    post_save.connect(_clear_cached_current, sender=_model)
+    post_delete.connect(_clear_cached_current, sender=_model)
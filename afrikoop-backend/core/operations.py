@@ -0,0 +1,58 @@
+"""
+Custom migration operations used by the ``core`` migrations.
+
+The operations here relax Django's locking behaviour where the backend
+allows it, and fall back to the stock behaviour everywhere else (notably
+SQLite, which is what local development runs on).
+"""
+from __future__ import annotations
+
+from django.db import NotSupportedError, migrations
+
+
+class AddIndexConcurrently(migrations.AddIndex):
+    """``AddIndex`` that uses ``CREATE INDEX CONCURRENTLY`` on PostgreSQL.
+
+    Building the index concurrently keeps the table writable while it is
+    created. PostgreSQL refuses to do that inside a transaction, so the
+    migration using this operation must set ``atomic = False``. Other
+    backends get a plain ``AddIndex``, so SQLite development databases
+    migrate the same way they always have.
+
+    Unlike ``django.contrib.postgres.operations.AddIndexConcurrently`` this
+    does not import the PostgreSQL driver, which is not installed for
+    SQLite-only deployments.
+    """
+
+    atomic = False
+
+    def _concurrently(self, schema_editor) -> bool:  # type: ignore[no-untyped-def]
+        if schema_editor.connection.vendor != 'postgresql':
+            return False
+        if schema_editor.connection.in_atomic_block:
+            raise NotSupportedError(
+                'The %s operation cannot be executed inside a transaction '
+                '(set atomic = False on the migration).' % self.__class__.__name__
+            )
+        return True
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):  # type: ignore[no-untyped-def]
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if self._concurrently(schema_editor):
+            schema_editor.add_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.add_index(model, self.index)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):  # type: ignore[no-untyped-def]
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if self._concurrently(schema_editor):
+            schema_editor.remove_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, self.index)
+
+    def describe(self) -> str:
+        return 'Concurrently create index %s on model %s' % (self.index.name, self.model_name)
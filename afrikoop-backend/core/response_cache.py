@@ -0,0 +1,56 @@
+"""
+Versioned cache for the public content endpoints' JSON responses.
+
+``cached_json_response(Model)`` stores a view's successful ``GET``
+response body in the default cache, keyed by the site, path, ``lang``
+parameter and ``Model.current_version()``. That is the version
+``SingletonSettingsMixin.current()`` caches the row under, so a response
+is only ever stored under the version of the content it was built from:
+saving or deleting the model (or one of its child rows) moves both to a
+new version at once when the transaction commits, and the old entries
+simply expire.
+
+Versions live in the default cache too. With a shared backend (Redis,
+see ``REDIS_URL``) every worker sees a new version at once; with the
+per-process fallback ``settings.RESPONSE_CACHE_TIMEOUT`` stays short.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+
+
+def cached_json_response(model):  # type: ignore[no-untyped-def]
+    """Cache a JSON view's ``GET`` responses until ``model`` changes."""
+
+    def decorator(view_func):  # type: ignore[no-untyped-def]
+        @functools.wraps(view_func)
+        def wrapper(request: HttpRequest, *args, **kwargs):  # type: ignore[no-untyped-def]
+            if request.method != 'GET':
+                return view_func(request, *args, **kwargs)
+            # Responses embed absolute media URLs, so the site is part of the key.
+            # Only ``lang`` changes the output; other query parameters are ignored.
+            raw = '|'.join((
+                str(model.current_version()),
+                request.scheme,
+                request.get_host(),
+                request.path,
+                request.GET.get('lang', ''),
+            ))
+            key = 'core:resp:' + hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+            hit = cache.get(key)
+            if hit is not None:
+                body, content_type = hit
+                return HttpResponse(body, content_type=content_type)
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                cache.set(key, (response.content, response['Content-Type']), settings.RESPONSE_CACHE_TIMEOUT)
+            return response
+
+        return wrapper
+
+    return decorator
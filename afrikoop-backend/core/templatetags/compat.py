@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import functools
+
 from django import template
 
 register = template.Library()
 
 
+@functools.lru_cache(maxsize=None)
+def _as_int(arg) -> int | None:  # type: ignore[no-untyped-def]
+    # Templates pass the same few literals ('1', '2') over and over.
+    try:
+        return int(arg)
+    except (TypeError, ValueError):
+        return None
+
+
 @register.filter(name="length_is")
 def length_is(value, arg):  # type: ignore[no-untyped-def]
     """Compat filter for third‑party templates expecting ``length_is``.
@@ -13,7 +24,12 @@ def length_is(value, arg):  # type: ignore[no-untyped-def]
     built‑in filter so Jazzmin/Admin templates that still reference it work.
     """
     try:
-        return len(value) == int(arg)
-    except Exception:
+        expected = _as_int(arg)
+    except TypeError:  # unhashable argument
+        return False
+    if expected is None:
+        return False
+    try:
+        return len(value) == expected
+    except TypeError:
         return False
-
@@ -3,30 +3,61 @@ from __future__ import annotations
 from datetime import timedelta
 
 from django import template
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
 from django.utils import timezone
 
-from core.models import ContactMessage, Event, EventRegistration
+from core.models import ContactMessage, Event
 
 register = template.Library()
 
+# The dashboard KPIs are shared by every admin page view; a short TTL keeps
+# them fresh enough while sparing the database its aggregate queries per render.
+_STATS_CACHE_KEY = 'core_admin_stats_v1'
+_STATS_TTL = 30
+_STATS_CONTACT_DAYS = 30
+
+
+def _compute_stats() -> dict[str, int]:
+    now = timezone.now()
+    events = Event.objects.aggregate(
+        total=Count('id'),
+        upcoming=Count('id', filter=Q(start_datetime__gte=now)),
+        registrations=Sum('registrations_count'),
+    )
+    return {
+        'total_events': events['total'],
+        'upcoming_events': events['upcoming'],
+        'registrations': events['registrations'] or 0,
+        'recent_contacts': ContactMessage.objects.filter(
+            sent_at__gte=now - timedelta(days=_STATS_CONTACT_DAYS)
+        ).count(),
+    }
+
+
+def _stats() -> dict[str, int]:
+    return cache.get_or_set(_STATS_CACHE_KEY, _compute_stats, _STATS_TTL)
+
 
 @register.simple_tag
 def total_events() -> int:
-    return Event.objects.count()
+    return _stats()['total_events']
 
 
 @register.simple_tag
 def upcoming_events_count() -> int:
-    return Event.objects.filter(start_datetime__gte=timezone.now()).count()
+    return _stats()['upcoming_events']
 
 
 @register.simple_tag
 def registrations_count() -> int:
-    return EventRegistration.objects.count()
+    return _stats()['registrations']
 
 
 @register.simple_tag
 def contact_count(days: int = 30) -> int:
+    if days == _STATS_CONTACT_DAYS:
+        return _stats()['recent_contacts']
     since = timezone.now() - timedelta(days=days)
     return ContactMessage.objects.filter(sent_at__gte=since).count()
 
@@ -35,11 +66,11 @@ def contact_count(days: int = 30) -> int:
 def upcoming_events(limit: int = 5):
     return (
         Event.objects.filter(start_datetime__gte=timezone.now())
+        .only('id', 'title_en', 'start_datetime', 'location')
         .order_by('start_datetime')[:limit]
     )
 
 
 @register.simple_tag
 def recent_messages(limit: int = 5):
-    return ContactMessage.objects.order_by('-sent_at')[:limit]
-
+    return ContactMessage.objects.only('id', 'name', 'sent_at').order_by('-sent_at')[:limit]
@@ -13,12 +13,17 @@ from django.urls import path
 from . import views
 
 
+# Django tries patterns in order, so the routes every page load hits (the
+# i18n bundles and the events list) come first.
 urlpatterns = [
+    # i18n bundles for the frontend
+    path('i18n/<str:lang>/', views.i18n_view, name='i18n-merged'),
+    path('i18n/<str:lang>/<str:namespace>.json', views.i18n_namespace_view, name='i18n-namespace'),
     # Public content endpoints
-    path('mission/', views.mission_view, name='mission'),
-    path('cleaning-service/', views.cleaning_service_view, name='cleaning-service'),
     path('events/', views.events_list_view, name='events-list'),
     path('events-page/', views.events_page_settings_view, name='events-page'),
+    path('mission/', views.mission_view, name='mission'),
+    path('cleaning-service/', views.cleaning_service_view, name='cleaning-service'),
     # Event registration
     path('events/<int:event_id>/register/', views.event_register_view, name='event-register'),
     # Authentication endpoints
@@ -27,7 +32,4 @@ urlpatterns = [
     path('auth/logout/', views.logout_view, name='logout'),
     # Contact form
     path('contact/', views.contact_view, name='contact'),
-    # i18n bundles for the frontend
-    path('i18n/<str:lang>/', views.i18n_view, name='i18n-merged'),
-    path('i18n/<str:lang>/<str:namespace>.json', views.i18n_namespace_view, name='i18n-namespace'),
 ]
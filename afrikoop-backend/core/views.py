@@ -15,15 +15,24 @@ decorators and handle CSRF tokens on the client.
 """
 from __future__ import annotations
 
-import json
-from datetime import datetime
+import hashlib
+from datetime import datetime, timedelta, timezone as dt_timezone
+from types import SimpleNamespace
 
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.hashers import make_password
-from django.http import HttpRequest, JsonResponse
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q, Window
+from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.views.decorators.cache import cache_control
 from django.views.decorators.csrf import csrf_exempt
 
+from . import auth_cache, i18n_cache
+from .http import JsonResponse, loads as json_loads, require_GET, require_POST
+from .response_cache import cached_json_response
 from .models import (  # noqa: F401
     CleaningServicePage,
     ContactMessage,
@@ -31,6 +40,7 @@ from .models import (  # noqa: F401
     EventRegistration,
     EventsPageSettings,
     MissionPage,
+    SiteTextSettings,
     TranslatableString,
     Token,
 )
@@ -44,10 +54,9 @@ def parse_request_body(request: HttpRequest) -> dict:
     If the body cannot be parsed, returns an empty dict.
     """
     try:
-        body_unicode = request.body.decode('utf-8')
-        if not body_unicode:
+        if not request.body:
             return {}
-        return json.loads(body_unicode)
+        return json_loads(request.body)
     except Exception:
         return {}
 
@@ -57,8 +66,9 @@ def require_token(view_func):
 
     This decorator expects the ``Authorization`` header to be in the
     format ``Token <key>``. If the token is valid, ``request.user``
-    will be set to the associated ``User`` instance. Otherwise a
-    401 response is returned.
+    will be set to the associated ``User`` instance and
+    ``request.auth_key`` to the key. Otherwise a 401 response is
+    returned.
     """
 
     def wrapper(request: HttpRequest, *args, **kwargs):
@@ -67,17 +77,71 @@ def require_token(view_func):
         if not auth_header.startswith(prefix):
             return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
         key = auth_header[len(prefix):].strip()
-        try:
-            token = Token.objects.get(key=key)
-        except Token.DoesNotExist:
+        user = auth_cache.get_user(key)
+        if user is None:
             return JsonResponse({'detail': 'Invalid token.'}, status=401)
-        request.user = token.user  # type: ignore[attr-defined]
+        request.user = user  # type: ignore[attr-defined]
+        request.auth_key = key  # type: ignore[attr-defined]
         return view_func(request, *args, **kwargs)
 
     return wrapper
 
 
+# Public content edited through the admin: browsers and CDNs may reuse it
+# for a minute and serve it stale while revalidating. The language is a
+# query parameter, so it is already part of every cache key.
+_public_cache = cache_control(public=True, max_age=60, stale_while_revalidate=300)
+
+
+def _media_url_builder(request: HttpRequest):  # type: ignore[no-untyped-def]
+    """Return a function making media URLs absolute for ``request``.
+
+    Root-relative URLs (local storage, already percent-encoded) are joined
+    to the scheme and host worked out once, instead of re-parsing them
+    with ``build_absolute_uri`` per image; anything else goes through it.
+    """
+    base = request.build_absolute_uri('/')[:-1]
+
+    def absolute(url: str) -> str:
+        if url.startswith('/') and not url.startswith('//'):
+            return base + url
+        return request.build_absolute_uri(url)
+
+    return absolute
+
+
+def _language_builders(*fields: str) -> dict:
+    """Build ``{lang: builder}`` for objects with ``<field>_en``/``<field>_ja`` attributes.
+
+    The ``'en'``/``'ja'`` builders return ``{field: ...}`` in that language;
+    the ``None`` builder (any other ``lang``) returns both suffixed variants.
+    """
+
+    def single(lang: str):  # type: ignore[no-untyped-def]
+        names = [(field, f'{field}_{lang}') for field in fields]
+        return lambda obj: {field: getattr(obj, name) for field, name in names}
+
+    both = [f'{field}_{lang}' for field in fields for lang in ('en', 'ja')]
+    return {
+        'en': single('en'),
+        'ja': single('ja'),
+        None: lambda obj: {name: getattr(obj, name) for name in both},
+    }
+
+
+_MISSION_TEXT = _language_builders('title', 'body')
+_MISSION_DEFAULTS = SimpleNamespace(
+    title_en='House of Bijou',
+    title_ja='House of Bijou',
+    body_en='House of Bijou celebrates the shared roots and solidarity between African/Black and Asian communities.',
+    body_ja='House of Bijou は、アフリカン/ブラックとアジアのコミュニティのつながりと連帯を祝福します。',
+)
+
+
 @csrf_exempt
+@require_GET
+@_public_cache
+@cached_json_response(MissionPage)
 def mission_view(request: HttpRequest) -> JsonResponse:
     """Return the mission page content in JSON format.
 
@@ -93,37 +157,13 @@ def mission_view(request: HttpRequest) -> JsonResponse:
             "updated_at": "2025-09-04T12:00:00Z"
         }
     """
-    if request.method != 'GET':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    page = MissionPage.objects.first()
-    lang = request.GET.get('lang')
-    data: dict[str, object] = {}
+    page = MissionPage.current()
+    build = _MISSION_TEXT.get(request.GET.get('lang'), _MISSION_TEXT[None])
     if page is None:
         # Friendly defaults so the frontend can render without admin content yet
-        defaults = {
-            'title_en': 'House of Bijou',
-            'title_ja': 'House of Bijou',
-            'body_en': 'House of Bijou celebrates the shared roots and solidarity between African/Black and Asian communities.',
-            'body_ja': 'House of Bijou は、アフリカン/ブラックとアジアのコミュニティのつながりと連帯を祝福します。',
-            'hero_image': None,
-        }
-        if lang == 'en':
-            return JsonResponse({'title': defaults['title_en'], 'body': defaults['body_en'], 'hero_image': None})
-        if lang == 'ja':
-            return JsonResponse({'title': defaults['title_ja'], 'body': defaults['body_ja'], 'hero_image': None})
-        return JsonResponse(defaults)
-
-    if lang == 'en':
-        data['title'] = page.title_en
-        data['body'] = page.body_en
-    elif lang == 'ja':
-        data['title'] = page.title_ja
-        data['body'] = page.body_ja
-    else:
-        data['title_en'] = page.title_en
-        data['title_ja'] = page.title_ja
-        data['body_en'] = page.body_en
-        data['body_ja'] = page.body_ja
+        return JsonResponse({**build(_MISSION_DEFAULTS), 'hero_image': None})
+
+    data: dict[str, object] = build(page)
     data['hero_image'] = (
         request.build_absolute_uri(page.hero_image.url) if page.hero_image else None
     )
@@ -131,95 +171,60 @@ def mission_view(request: HttpRequest) -> JsonResponse:
     return JsonResponse(data)
 
 
+_CLEANING_TEXT = _language_builders('title', 'description', 'cta')
+_CLEANING_FEATURE = {
+    'en': lambda f: {'text': f.text_en, 'color': f.color},
+    'ja': lambda f: {'text': f.text_ja or f.text_en, 'color': f.color},
+    None: lambda f: {'text_en': f.text_en, 'text_ja': f.text_ja, 'color': f.color},
+}
+_CLEANING_DEFAULTS = SimpleNamespace(
+    title_en='Airbnb Cleaning',
+    title_ja='清掃サービス',
+    description_en='Professional, reliable short-stay cleaning by members of the house. Flexible scheduling and hotel-standard turnover.',
+    description_ja='コミュニティメンバーによる信頼できる清掃。柔軟なスケジュールとホテル品質の仕上がり。',
+    cta_en='Tell us your schedule and property details — we’ll get back with a quote.',
+    cta_ja='日程と物件情報をお知らせください。お見積もりをご連絡します。',
+    features=[
+        SimpleNamespace(text_en='Full turnover: linens, bathroom, kitchen, reset staging', text_ja='フルターン：リネン、バスルーム、キッチン、ステージング復元', color='primary'),
+        SimpleNamespace(text_en='Restock consumables and basic supplies', text_ja='消耗品・基本備品の補充', color='accent'),
+        SimpleNamespace(text_en='Flexible scheduling and quick response', text_ja='柔軟なスケジュールと迅速対応', color='secondary'),
+        SimpleNamespace(text_en='Photo reporting on completion (optional)', text_ja='写真レポート（任意）', color='primary'),
+    ],
+)
+
+
 @csrf_exempt
+@require_GET
+@_public_cache
+@cached_json_response(CleaningServicePage)
 def cleaning_service_view(request: HttpRequest) -> JsonResponse:
     """Return the cleaning service page content in JSON format.
 
     Accepts the same ``lang`` parameter as ``mission_view``.
     """
-    if request.method != 'GET':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    page = CleaningServicePage.objects.first()
+    page = CleaningServicePage.current()
     lang = request.GET.get('lang')
-    data: dict[str, object] = {}
+    build = _CLEANING_TEXT.get(lang, _CLEANING_TEXT[None])
+    build_feature = _CLEANING_FEATURE.get(lang, _CLEANING_FEATURE[None])
     if page is None:
         # Return friendly defaults instead of 404 so the frontend can render placeholders
-        defaults = {
-            'title_en': 'Airbnb Cleaning',
-            'title_ja': '清掃サービス',
-            'description_en': 'Professional, reliable short-stay cleaning by members of the house. Flexible scheduling and hotel-standard turnover.',
-            'description_ja': 'コミュニティメンバーによる信頼できる清掃。柔軟なスケジュールとホテル品質の仕上がり。',
-            'cta_en': 'Tell us your schedule and property details — we’ll get back with a quote.',
-            'cta_ja': '日程と物件情報をお知らせください。お見積もりをご連絡します。',
-            'image': None,
-            'features': [
-                {'text_en': 'Full turnover: linens, bathroom, kitchen, reset staging', 'text_ja': 'フルターン：リネン、バスルーム、キッチン、ステージング復元', 'color': 'primary'},
-                {'text_en': 'Restock consumables and basic supplies', 'text_ja': '消耗品・基本備品の補充', 'color': 'accent'},
-                {'text_en': 'Flexible scheduling and quick response', 'text_ja': '柔軟なスケジュールと迅速対応', 'color': 'secondary'},
-                {'text_en': 'Photo reporting on completion (optional)', 'text_ja': '写真レポート（任意）', 'color': 'primary'},
-            ],
-        }
-        if lang == 'ja':
-            return JsonResponse({
-                'title': defaults['title_ja'],
-                'description': defaults['description_ja'],
-                'cta': defaults['cta_ja'],
-                'image': None,
-                'features': [{'text': f['text_ja'], 'color': f['color']} for f in defaults['features']],
-            })
-        elif lang == 'en':
-            return JsonResponse({
-                'title': defaults['title_en'],
-                'description': defaults['description_en'],
-                'cta': defaults['cta_en'],
-                'image': None,
-                'features': [{'text': f['text_en'], 'color': f['color']} for f in defaults['features']],
-            })
-        else:
-            return JsonResponse(defaults)
-
-    # Build features list from DB page
-    features = [
-        {
-            'text_en': f.text_en,
-            'text_ja': f.text_ja,
-            'color': f.color,
-        }
-        for f in page.features.all()
-    ]
-
-    if lang == 'en':
-        data['title'] = page.title_en
-        data['description'] = page.description_en
-        data['cta'] = page.cta_en
-        data['features'] = [
-            {'text': f['text_en'], 'color': f['color']} for f in features
-        ]
-    elif lang == 'ja':
-        data['title'] = page.title_ja
-        data['description'] = page.description_ja
-        data['cta'] = page.cta_ja
-        data['features'] = [
-            {'text': (f['text_ja'] or f['text_en']), 'color': f['color']} for f in features
-        ]
-    else:
-        data['title_en'] = page.title_en
-        data['title_ja'] = page.title_ja
-        data['description_en'] = page.description_en
-        data['description_ja'] = page.description_ja
-        data['cta_en'] = page.cta_en
-        data['cta_ja'] = page.cta_ja
-        data['features'] = features
+        data: dict[str, object] = build(_CLEANING_DEFAULTS)
+        data['image'] = None
+        data['features'] = [build_feature(f) for f in _CLEANING_DEFAULTS.features]
+        return JsonResponse(data)
 
+    data = build(page)
+    data['features'] = [build_feature(f) for f in page.features.all()]
     data['updated_at'] = page.updated_at.isoformat()
     data['image'] = (
         request.build_absolute_uri(page.image.url) if page.image else None
     )
     # Include up to 3 gallery images
     gallery = []
+    media_url = _media_url_builder(request)
     for g in page.gallery_images.all()[:3]:
         gallery.append({
-            'url': request.build_absolute_uri(g.image.url),
+            'url': media_url(g.image.url),
             'caption_en': g.caption_en,
             'caption_ja': g.caption_ja,
         })
@@ -227,7 +232,31 @@ def cleaning_service_view(request: HttpRequest) -> JsonResponse:
     return JsonResponse(data)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def _event_cursor(event: Event) -> str:
+    """Encode an event's position in the events list as ``<µs since epoch>_<id>``."""
+    return f'{(event.start_datetime - _EPOCH) // timedelta(microseconds=1)}_{event.id}'
+
+
+def _parse_event_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode ``_event_cursor`` output; raises ``ValueError`` if malformed."""
+    micros, sep, event_id = cursor.partition('_')
+    if not sep:
+        raise ValueError(cursor)
+    try:
+        return _EPOCH + timedelta(microseconds=int(micros)), int(event_id)
+    except OverflowError as exc:
+        raise ValueError(cursor) from exc
+
+
+_EVENT_TEXT = _language_builders('title', 'description')
+
+
 @csrf_exempt
+@require_GET
+@cache_control(public=True, max_age=15)
 def events_list_view(request: HttpRequest) -> JsonResponse:
     """Return a list of upcoming events.
 
@@ -235,26 +264,41 @@ def events_list_view(request: HttpRequest) -> JsonResponse:
         lang: 'en' or 'ja' to return titles/descriptions in one language.
         past: 'true' to include past events; by default only future
               events are returned.
+        page, page_size: offset pagination (page_size defaults to 9).
+        cursor: the ``next_cursor`` of a previous response; continues
+              after that page without counting or skipping rows.
 
     Response body:
-        [
-            {
-                "id": 1,
-                "title_en": "Beach Cleanup",
-                "title_ja": "ビーチの清掃",
-                "description_en": "...",
-                "description_ja": "...",
-                "start_datetime": "2025-09-20T09:00:00Z",
-                "location": "Lake Biwa",
-                "capacity": 10,
-                "available_slots": 3
-            },
-            ...
-        ]
+        {
+            "results": [
+                {
+                    "id": 1,
+                    "title_en": "Beach Cleanup",
+                    "title_ja": "ビーチの清掃",
+                    "description_en": "...",
+                    "description_ja": "...",
+                    "start_datetime": "2025-09-20T09:00:00Z",
+                    "location": "Lake Biwa",
+                    "capacity": 10,
+                    "available_slots": 3,
+                    "images": [{"url": "...", "caption_en": "...", "caption_ja": "..."}]
+                },
+                ...
+            ],
+            "page": 1,
+            "page_size": 9,
+            "total": 12,
+            "total_pages": 2,
+            "has_next": true,
+            "has_prev": false,
+            "next_cursor": "1758358800000000_7"
+        }
+
+        ``page`` is omitted from responses to a ``cursor`` request, and
+        ``total`` is then refreshed at most every few minutes.
+        ``next_cursor`` is null on the last page.
     """
-    if request.method != 'GET':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    lang = request.GET.get('lang')
+    build = _EVENT_TEXT.get(request.GET.get('lang'), _EVENT_TEXT[None])
     include_past = request.GET.get('past', 'false').lower() == 'true'
     # Simple pagination params
     try:
@@ -266,109 +310,118 @@ def events_list_view(request: HttpRequest) -> JsonResponse:
     except ValueError:
         page_size = 9
     now = timezone.now()
-    qs = Event.objects.all()
+    qs = Event.with_children.all()
     if not include_past:
         qs = qs.filter(start_datetime__gte=now)
-    # Ensure newest first
-    qs = qs.order_by('-start_datetime')
+    # Ensure newest first (id breaks ties so cursors are unambiguous)
+    qs = qs.order_by('-start_datetime', '-id')
 
-    total = qs.count()
-    total_pages = (total + page_size - 1) // page_size if total else 1
-    # Clamp page to available range
-    if page > total_pages:
-        page = total_pages
-
-    start = (page - 1) * page_size
-    end = start + page_size
+    cursor = request.GET.get('cursor')
+    if cursor:
+        try:
+            after_start, after_id = _parse_event_cursor(cursor)
+        except ValueError:
+            return JsonResponse({'detail': 'Invalid cursor.'}, status=400)
+        rows = list(
+            qs.filter(
+                Q(start_datetime__lt=after_start) | Q(start_datetime=after_start, id__lt=after_id)
+            )[:page_size + 1]
+        )
+        has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        # Informational only here; a slightly stale figure spares a COUNT per page.
+        total = cache.get_or_set(f'core:events_total:{int(include_past)}', qs.count, 300)
+        total_pages = (total + page_size - 1) // page_size if total else 1
+        has_prev = True
+    else:
+        # COUNT(*) OVER () brings the total back with the page itself.
+        counted = qs.annotate(total_rows=Window(Count('*')))
+        start = (page - 1) * page_size
+        rows = list(counted[start:start + page_size])
+        if rows:
+            total = rows[0].total_rows
+        elif page == 1:
+            total = 0
+        else:
+            # Past the last page: count, then clamp page to available range.
+            total = qs.count()
+            page = max((total + page_size - 1) // page_size, 1)
+            if total:
+                rows = list(counted[(page - 1) * page_size:page * page_size])
+        total_pages = (total + page_size - 1) // page_size if total else 1
+        has_next = page < total_pages
+        has_prev = page > 1
 
     events = []
-    for event in qs.select_related().prefetch_related('images')[start:end]:
+    media_url = _media_url_builder(request)
+    for event in rows:
         item: dict[str, object] = {
             'id': event.id,
             'start_datetime': event.start_datetime.isoformat(),
             'location': event.location,
             'capacity': event.capacity,
             'available_slots': event.available_slots,
+            **build(event),
         }
-        if lang == 'en':
-            item['title'] = event.title_en
-            item['description'] = event.description_en
-        elif lang == 'ja':
-            item['title'] = event.title_ja
-            item['description'] = event.description_ja
-        else:
-            item['title_en'] = event.title_en
-            item['title_ja'] = event.title_ja
-            item['description_en'] = event.description_en
-            item['description_ja'] = event.description_ja
         # Attach images (no heavy resizing here)
         imgs = []
         for img in event.images.all():
             imgs.append({
-                'url': request.build_absolute_uri(img.image.url),
+                'url': media_url(img.image.url),
                 'caption_en': img.caption_en,
                 'caption_ja': img.caption_ja,
             })
         item['images'] = imgs
         events.append(item)
-    return JsonResponse({
+    data: dict[str, object] = {
         'results': events,
         'page': page,
         'page_size': page_size,
         'total': total,
         'total_pages': total_pages,
-        'has_next': page < total_pages,
-        'has_prev': page > 1,
-    })
+        'has_next': has_next,
+        'has_prev': has_prev,
+        'next_cursor': _event_cursor(rows[-1]) if has_next and rows else None,
+    }
+    if cursor:
+        # A cursor page has no page number.
+        del data['page']
+    return JsonResponse(data)
+
+
+_EVENTS_PAGE_TEXT = _language_builders('title', 'subtitle')
+_EVENTS_PAGE_DEFAULTS = SimpleNamespace(
+    title_en='Upcoming Events',
+    title_ja='イベント情報',
+    subtitle_en='Join community gatherings, volunteer days, and workshops. New dates drop regularly — check back soon!',
+    subtitle_ja='コミュニティイベント、ボランティア、ワークショップなど。最新情報をお見逃しなく！',
+)
 
 
 @csrf_exempt
+@require_GET
+@_public_cache
+@cached_json_response(EventsPageSettings)
 def events_page_settings_view(request: HttpRequest) -> JsonResponse:
     """Return Events page hero settings (title/subtitle/hero image).
 
     Accepts ``lang`` like other endpoints.
     """
-    if request.method != 'GET':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    lang = request.GET.get('lang')
-    obj = EventsPageSettings.objects.first()
-    if not obj:
-        # Provide sensible defaults if admin has not configured it yet
-        data = {
-            'title_en': 'Upcoming Events',
-            'title_ja': 'イベント情報',
-            'subtitle_en': 'Join community gatherings, volunteer days, and workshops. New dates drop regularly — check back soon!',
-            'subtitle_ja': 'コミュニティイベント、ボランティア、ワークショップなど。最新情報をお見逃しなく！',
-            'hero_image': None,
-        }
-    else:
-        data = {
-            'title_en': obj.title_en,
-            'title_ja': obj.title_ja,
-            'subtitle_en': obj.subtitle_en,
-            'subtitle_ja': obj.subtitle_ja,
-            'hero_image': (
-                request.build_absolute_uri(obj.hero_image.url) if obj.hero_image else None
-            ),
-            'updated_at': obj.updated_at.isoformat(),
-        }
-
-    if lang == 'en':
-        return JsonResponse({
-            'title': data.get('title_en'),
-            'subtitle': data.get('subtitle_en'),
-            'hero_image': data.get('hero_image'),
-        })
-    if lang == 'ja':
-        return JsonResponse({
-            'title': data.get('title_ja'),
-            'subtitle': data.get('subtitle_ja'),
-            'hero_image': data.get('hero_image'),
-        })
+    obj = EventsPageSettings.current()
+    build = _EVENTS_PAGE_TEXT.get(request.GET.get('lang'), _EVENTS_PAGE_TEXT[None])
+    # Sensible defaults if admin has not configured it yet
+    data: dict[str, object] = build(obj or _EVENTS_PAGE_DEFAULTS)
+    data['hero_image'] = (
+        request.build_absolute_uri(obj.hero_image.url) if obj and obj.hero_image else None
+    )
+    # Only the bilingual response carries the timestamp.
+    if obj and build is _EVENTS_PAGE_TEXT[None]:
+        data['updated_at'] = obj.updated_at.isoformat()
     return JsonResponse(data)
 
 
 @csrf_exempt
+@require_POST
 @require_token
 def event_register_view(request: HttpRequest, event_id: int) -> JsonResponse:
     """Register the authenticated user for an event.
@@ -377,24 +430,25 @@ def event_register_view(request: HttpRequest, event_id: int) -> JsonResponse:
     header with a valid token. Returns 201 on success, 400 if the
     event is full or the user is already registered.
     """
-    if request.method != 'POST':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    try:
-        event = Event.objects.get(pk=event_id)
-    except Event.DoesNotExist:
-        return JsonResponse({'detail': 'Event not found.'}, status=404)
-    # Check if event is full
-    if event.is_full():
-        return JsonResponse({'detail': 'Event is full.'}, status=400)
-    # Check if already registered
-    if EventRegistration.objects.filter(user=request.user, event=event).exists():
+    # Lock the event row so concurrent registrations cannot both take the
+    # last slot; the counter is bumped in the same transaction.
+    with transaction.atomic():
+        try:
+            event = Event.objects.select_for_update().get(pk=event_id)
+        except Event.DoesNotExist:
+            return JsonResponse({'detail': 'Event not found.'}, status=404)
+        # Check if event is full
+        if event.is_full():
+            return JsonResponse({'detail': 'Event is full.'}, status=400)
+        # get_or_create also absorbs a duplicate insert racing this one
+        _, created = EventRegistration.objects.get_or_create(user=request.user, event=event)
+    if not created:
         return JsonResponse({'detail': 'Already registered.'}, status=400)
-    # Create registration
-    EventRegistration.objects.create(user=request.user, event=event)
     return JsonResponse({'detail': 'Registered successfully.'}, status=201)
 
 
 @csrf_exempt
+@require_POST
 def register_user_view(request: HttpRequest) -> JsonResponse:
     """Register a new user.
 
@@ -402,36 +456,43 @@ def register_user_view(request: HttpRequest) -> JsonResponse:
     Returns 201 on success or 400 on validation errors. Passwords are
     hashed using Django's password hashing utilities.
     """
-    if request.method != 'POST':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
     data = parse_request_body(request)
     username = data.get('username', '').strip()
     email = data.get('email', '').strip()
     password = data.get('password', '')
     if not username or not email or not password:
         return JsonResponse({'detail': 'Username, email and password are required.'}, status=400)
-    if User.objects.filter(username=username).exists():
+    # One query for both uniqueness checks.
+    clashes = User.objects.filter(Q(username=username) | Q(email=email)).aggregate(
+        username=Count('pk', filter=Q(username=username)),
+        email=Count('pk', filter=Q(email=email)),
+    )
+    if clashes['username']:
         return JsonResponse({'detail': 'Username already exists.'}, status=400)
-    if User.objects.filter(email=email).exists():
+    if clashes['email']:
         return JsonResponse({'detail': 'Email already exists.'}, status=400)
-    user = User.objects.create(
-        username=username,
-        email=email,
-        password=make_password(password),
-    )
-    token = Token.create(user)
-    return JsonResponse({'token': token.key}, status=201)
+    try:
+        with transaction.atomic():
+            user = User.objects.create(
+                username=username,
+                email=email,
+                password=make_password(password),
+            )
+            token = Token.create(user)
+    except IntegrityError:
+        # A concurrent request took the username after the check above.
+        return JsonResponse({'detail': 'Username already exists.'}, status=400)
+    return JsonResponse({'token': token.raw_key}, status=201)
 
 
 @csrf_exempt
+@require_POST
 def login_view(request: HttpRequest) -> JsonResponse:
     """Log in a user and return an authentication token.
 
     Accepts JSON body containing ``username`` and ``password``. On
     success returns the token string. On failure returns 400 or 401.
     """
-    if request.method != 'POST':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
     data = parse_request_body(request)
     username = data.get('username', '').strip()
     password = data.get('password', '')
@@ -441,10 +502,11 @@ def login_view(request: HttpRequest) -> JsonResponse:
     if user is None:
         return JsonResponse({'detail': 'Invalid credentials.'}, status=401)
     token = Token.create(user)
-    return JsonResponse({'token': token.key})
+    return JsonResponse({'token': token.raw_key})
 
 
 @csrf_exempt
+@require_POST
 @require_token
 def logout_view(request: HttpRequest) -> JsonResponse:
     """Invalidate the current user's token.
@@ -452,15 +514,12 @@ def logout_view(request: HttpRequest) -> JsonResponse:
     Deletes the token so it can no longer be used. Clients should
     discard the token on their side as well.
     """
-    if request.method != 'POST':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    auth_header = request.headers.get('Authorization', '')
-    key = auth_header.replace('Token ', '').strip()
-    Token.objects.filter(key=key).delete()
+    Token.objects.filter(key=Token.hash_key(request.auth_key)).delete()  # type: ignore[attr-defined]
     return JsonResponse({'detail': 'Logged out.'})
 
 
 @csrf_exempt
+@require_POST
 def contact_view(request: HttpRequest) -> JsonResponse:
     """Process contact form submissions.
 
@@ -468,8 +527,6 @@ def contact_view(request: HttpRequest) -> JsonResponse:
     message in the database. Optionally send an email to site admins
     if an email backend is configured.
     """
-    if request.method != 'POST':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
     data = parse_request_body(request)
     name = data.get('name', '').strip()
     email = data.get('email', '').strip()
@@ -482,7 +539,9 @@ def contact_view(request: HttpRequest) -> JsonResponse:
 
 
 @csrf_exempt
-def i18n_view(request: HttpRequest, lang: str) -> JsonResponse:
+@require_GET
+@_public_cache
+def i18n_view(request: HttpRequest, lang: str) -> HttpResponse:
     """Return merged UI translations for one or more namespaces.
 
     - Path param: ``lang`` (e.g., ``en`` or ``ja``)
@@ -492,70 +551,39 @@ def i18n_view(request: HttpRequest, lang: str) -> JsonResponse:
     For multiple namespaces, returns a merged dict. Later keys override earlier ones
     if duplicates exist.
     """
-    if request.method != 'GET':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
     namespaces_param = request.GET.get('ns', 'common')
     namespaces = [ns.strip() for ns in namespaces_param.split(',') if ns.strip()]
-    # Collect rows
-    data: dict[str, str] = {}
-    latest_ts: float | None = None
-    for ns in namespaces:
-        rows = TranslatableString.objects.filter(language=lang, namespace=ns)
-        for row in rows:
-            data[row.key] = row.text
-            ts = row.updated_at.timestamp()
-            latest_ts = max(latest_ts or ts, ts)
-
-    # Merge in friendly site text settings (single record)
-    try:
-        from core.models import SiteTextSettings  # avoid circular import at module load
-        st = SiteTextSettings.objects.first()
-    except Exception:
-        st = None
-    if st:
-        if lang == 'ja':
-            data.update({
-                'home': st.home_label_ja,
-                'events': st.events_label_ja,
-                'cleaning': st.cleaning_label_ja,
-                'cleaning_short': st.cleaning_short_ja,
-                'login': st.login_ja,
-                'register': st.register_ja,
-                'logout': st.logout_ja,
-                'browse_events': st.browse_events_ja,
-                'learn_more': st.learn_more_ja,
-                'instagram_url': st.instagram_url,
-            })
-        else:
-            data.update({
-                'home': st.home_label_en,
-                'events': st.events_label_en,
-                'cleaning': st.cleaning_label_en,
-                'cleaning_short': st.cleaning_short_en,
-                'login': st.login_en,
-                'register': st.register_en,
-                'logout': st.logout_en,
-                'browse_events': st.browse_events_en,
-                'learn_more': st.learn_more_en,
-                'instagram_url': st.instagram_url,
-            })
-
-    # ETag header from latest update to aid caching
-    resp = JsonResponse(data)
-    if latest_ts is not None:
-        resp['ETag'] = f'W/"i18n-{lang}-{int(latest_ts)}"'
+    bundles = i18n_cache.get_bundles(lang, namespaces)
+    st = SiteTextSettings.current()
+
+    # Both inputs are cached, so the ETag costs no query and a matching
+    # If-None-Match skips building and serialising the merged body.
+    parts = [lang, *(bundle.etag for bundle in bundles), st.updated_at.isoformat() if st else '']
+    etag = '"%s"' % hashlib.md5('|'.join(parts).encode(), usedforsecurity=False).hexdigest()
+    resp = get_conditional_response(request, etag=etag)
+    if resp is None:
+        data: dict[str, str] = {}
+        for bundle in bundles:
+            data.update(bundle.data)
+        # Merge in friendly site text settings (single record)
+        if st:
+            data.update(st.labels_for('ja' if lang == 'ja' else 'en'))
+            data['instagram_url'] = st.instagram_url
+        resp = JsonResponse(data)
+    resp['ETag'] = etag
     return resp
 
 
 @csrf_exempt
-def i18n_namespace_view(request: HttpRequest, lang: str, namespace: str) -> JsonResponse:
+@require_GET
+@_public_cache
+def i18n_namespace_view(request: HttpRequest, lang: str, namespace: str) -> HttpResponse:
     """Return translations for a single namespace as JSON mapping."""
-    if request.method != 'GET':
-        return JsonResponse({'detail': 'Method not allowed.'}, status=405)
-    rows = TranslatableString.objects.filter(language=lang, namespace=namespace)
-    data = {row.key: row.text for row in rows}
-    resp = JsonResponse(data)
-    if rows:
-        latest_ts = max(r.updated_at.timestamp() for r in rows)
-        resp['ETag'] = f'W/"i18n-{lang}-{namespace}-{int(latest_ts)}"'
+    bundle = i18n_cache.get_bundle(lang, namespace)
+    # The ETag hashes the body, so it also changes when a string is deleted.
+    resp = get_conditional_response(request, etag=bundle.etag)
+    if resp is None:
+        # The bundle carries its JSON body already serialised.
+        resp = HttpResponse(bundle.body, content_type='application/json')
+    resp['ETag'] = bundle.etag
     return resp